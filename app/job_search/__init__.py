@@ -1,6 +1,21 @@
 """Job search module."""
+import importlib
+
 from .models import JobPosting
-from .searcher import JobSearcher
-from .platforms import LinkedInScraper, HackerNewsScraper
+
+# Loaded on first access; JobSearcher imports every platform scraper
+_LAZY_ATTRS = {
+    'JobSearcher': '.searcher',
+    'LinkedInScraper': '.platforms',
+    'HackerNewsScraper': '.platforms',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ['JobPosting', 'JobSearcher', 'LinkedInScraper', 'HackerNewsScraper']
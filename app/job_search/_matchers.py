@@ -0,0 +1,64 @@
+"""
+Shared keyword matchers for job text
+"""
+import re
+
+# Phrases hinting at how to apply, one tuple per method
+_EMAIL_PHRASES = (
+    "apply via email",
+    "send your resume to",
+    "email us at",
+    "apply by email",
+    "@",
+    "[at]",
+    "(at)"
+)
+
+_LINKEDIN_PHRASES = (
+    "apply on linkedin",
+    "linkedin.com/jobs",
+    "linkedin profile"
+)
+
+_WEBSITE_PHRASES = (
+    "apply on our website",
+    "apply through our website",
+    "apply at our website",
+    "apply here:",
+    "apply at:"
+)
+
+# Methods in priority order
+_APPLICATION_METHOD_PHRASES = (
+    ("email", _EMAIL_PHRASES),
+    ("linkedin", _LINKEDIN_PHRASES),
+    ("website", _WEBSITE_PHRASES),
+)
+
+# Case-insensitive so descriptions don't need a lowercased copy
+_APPLICATION_METHOD_RE = re.compile('|'.join(
+    f"(?P<{method}>{'|'.join(map(re.escape, phrases))})"
+    for method, phrases in _APPLICATION_METHOD_PHRASES
+), re.IGNORECASE)
+
+# Location/title keywords meaning the job can be done from anywhere
+_REMOTE_RE = re.compile(r'remote|anywhere|worldwide', re.IGNORECASE)
+
+def detect_application_method(description: str) -> str:
+    """Detect how to apply ('email', 'linkedin', 'website' or 'unknown')."""
+    # One scan collects every bucket present; buckets keep their priority order
+    found = set()
+    for match in _APPLICATION_METHOD_RE.finditer(description):
+        if match.lastgroup == "email":
+            return "email"
+        found.add(match.lastgroup)
+        
+    for method, _ in _APPLICATION_METHOD_PHRASES:
+        if method in found:
+            return method
+        
+    return "unknown"
+
+def detect_remote(text: str) -> bool:
+    """Check whether a title or location describes a remote position."""
+    return _REMOTE_RE.search(text) is not None
@@ -9,6 +9,28 @@ from loguru import logger
 from .post_analyzer import JobPostInfo
 from .resume_analyzer import ResumeInfo
 
+# Phrases that mark a job as remote, and phrases that rule it out; each list
+# is one case-insensitive alternation, so a text is scanned once per list
+_REMOTE_INDICATOR_RE = re.compile('|'.join(map(re.escape, (
+    'remote',
+    'work from home',
+    'wfh',
+    'virtual',
+    'distributed team',
+    'anywhere',
+    'worldwide',
+))), re.IGNORECASE)
+
+_NON_REMOTE_INDICATOR_RE = re.compile('|'.join(map(re.escape, (
+    'on-site',
+    'onsite',
+    'in office',
+    'hybrid',
+    'local only',
+    'must be in',
+    'must work from',
+))), re.IGNORECASE)
+
 @dataclass
 class MatchScore:
     """Detailed matching score between a candidate and a job post."""
@@ -132,41 +154,15 @@ class JobMatcher:
         
     def _is_remote_job(self, job: JobPostInfo) -> bool:
         """Check if job is remote."""
-        # Check location field
-        location = job.location.lower()
-        remote_indicators = [
-            'remote',
-            'work from home',
-            'wfh',
-            'virtual',
-            'distributed team',
-            'anywhere',
-            'worldwide'
-        ]
-        
-        non_remote_indicators = [
-            'on-site',
-            'onsite',
-            'in office',
-            'hybrid',
-            'local only',
-            'must be in',
-            'must work from'
-        ]
-        
         # If any non-remote indicators are found, job is not remote
-        if any(indicator in location for indicator in non_remote_indicators):
-            return False
-            
-        # Check description for remote indicators
-        description = job.description.lower()
-        if any(indicator in description for indicator in non_remote_indicators):
+        if (_NON_REMOTE_INDICATOR_RE.search(job.location)
+                or _NON_REMOTE_INDICATOR_RE.search(job.description)):
             return False
             
         # Must have at least one remote indicator in location or description
-        return any(
-            indicator in location or indicator in description 
-            for indicator in remote_indicators
+        return bool(
+            _REMOTE_INDICATOR_RE.search(job.location)
+            or _REMOTE_INDICATOR_RE.search(job.description)
         )
         
     def _calculate_skill_match(self, job: JobPostInfo, candidate: ResumeInfo) -> Tuple[float, Set[str], Set[str]]:
@@ -4,7 +4,6 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 from loguru import logger
 from playwright.async_api import Page, Browser, async_playwright
 
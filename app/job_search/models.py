@@ -1,13 +1,57 @@
 """
 Job Search Models
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Set, Dict, Any
 from datetime import datetime
+import functools
+import html
+import operator
 import re
 
 from app.utils.text_extractor import extract_emails_from_text
+from ._matchers import detect_application_method, detect_remote
 
+_unescape = html.unescape
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)."""
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = {k: v for k, v in cls.__dict__.items() if k not in field_names}
+    cls_dict['__slots__'] = field_names
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    
+    # Like slots=True, pickle and copy the field values explicitly: the
+    # default slot state is restored with setattr, which a frozen class rejects
+    def __getstate__(self):
+        return [getattr(self, name) for name in field_names]
+    
+    def __setstate__(self, state):
+        for name, value in zip(field_names, state):
+            object.__setattr__(self, name, value)
+    
+    cls_dict['__getstate__'] = __getstate__
+    cls_dict['__setstate__'] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+def _fast_to_dict(cls):
+    """Give a flat dataclass a to_dict() that skips asdict's recursive deep copy."""
+    field_names = tuple(f.name for f in fields(cls))
+    get_values = operator.attrgetter(*field_names)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        # Containers are copied one level deep so callers can't mutate the job
+        return {
+            name: value.copy() if isinstance(value, (list, set, dict)) else value
+            for name, value in zip(field_names, get_values(self))
+        }
+    
+    cls.to_dict = to_dict
+    return cls
+
+@functools.lru_cache(maxsize=4096)
 def normalize_location(location: str) -> str:
     """Normalize location string."""
     # Common location prefixes to remove
@@ -36,7 +80,7 @@ def normalize_location(location: str) -> str:
             location = location[:-len(suffix)].strip()
     
     # Handle special cases
-    if any(keyword in location.lower() for keyword in ['remote', 'anywhere', 'worldwide']):
+    if detect_remote(location):
         return 'Remote'
         
     # Remove parenthetical clarifications
@@ -45,11 +89,33 @@ def normalize_location(location: str) -> str:
     # Clean up remaining text
     location = location.strip(' ,:;.-')
     
-    # Capitalize properly
-    location = ' '.join(word.capitalize() for word in location.split())
+    # Collapse whitespace and capitalize properly
+    location = ' '.join(location.split()).title()
     
     return location
 
+# Salary formats, most specific first so a range wins over its own lower bound
+_SALARY_RE = re.compile(
+    # Range with K suffix: $100K-150K
+    r'(?P<range_k>\$(?P<range_k_min>\d+)K\s*[-–]\s*\$?(?P<range_k_max>\d+)K)'
+    # Range with thousand: $100,000-150,000
+    r'|(?P<range>\$(?P<range_min>\d{1,3}(?:,\d{3})*)\s*[-–]\s*\$?(?P<range_max>\d{1,3}(?:,\d{3})*))'
+    # Single value with K suffix: $100K
+    r'|(?P<single_k>\$(?P<single_k_value>\d+)K)'
+    # Single value with thousand: $100,000
+    r'|(?P<single>\$(?P<single_value>\d{1,3}(?:,\d{3})*))'
+)
+
+# Currency markers, one named group per currency code
+_CURRENCY_RE = re.compile(
+    r'(?P<USD>\$|USD|US\s*dollars?)'
+    r'|(?P<EUR>€|EUR|euros?)'
+    r'|(?P<GBP>£|GBP|pounds?)',
+    re.IGNORECASE
+)
+
+@_slotted
+@_fast_to_dict
 @dataclass
 class Job:
     """Job posting model."""
@@ -64,72 +130,46 @@ class Job:
     salary_currency: str = "USD"
     application_method: str = "unknown"
     remote: bool = False
-    skills: Set[str] = None
+    skills: Set[str] = field(default_factory=set)
     
     def __post_init__(self):
         """Post initialization processing."""
         # Decode HTML entities
-        self.title = html.unescape(self.title)
-        self.company = html.unescape(self.company)
-        self.description = html.unescape(self.description)
+        self.title = _unescape(self.title)
+        self.company = _unescape(self.company)
+        self.description = _unescape(self.description)
         
         # Normalize location
         self.location = normalize_location(self.location)
         
-        # Initialize skills set
-        if self.skills is None:
-            self.skills = set()
-            
         # Extract salary information
         self._extract_salary_info()
             
     def _extract_salary_info(self):
         """Extract salary information from description."""
-        # Common salary patterns
-        patterns = [
-            # Range with K suffix: $100K-150K
-            r'\$(\d+)K\s*[-–]\s*\$?(\d+)K',
-            # Range with thousand: $100,000-150,000
-            r'\$(\d{1,3}(?:,\d{3})*)\s*[-–]\s*\$?(\d{1,3}(?:,\d{3})*)',
-            # Single value with K suffix: $100K
-            r'\$(\d+)K',
-            # Single value with thousand: $100,000
-            r'\$(\d{1,3}(?:,\d{3})*)',
-        ]
-        
-        desc_lower = self.description.lower()
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, self.description)
-            for match in matches:
-                if len(match.groups()) == 2:  # Range
-                    min_val = float(match.group(1).replace(',', ''))
-                    max_val = float(match.group(2).replace(',', ''))
-                    if 'k' in pattern.lower():
-                        min_val *= 1000
-                        max_val *= 1000
-                    self.salary_min = min_val
-                    self.salary_max = max_val
-                    break
-                else:  # Single value
-                    val = float(match.group(1).replace(',', ''))
-                    if 'k' in pattern.lower():
-                        val *= 1000
-                    self.salary_min = val
-                    self.salary_max = val
-                    break
-                    
+        description = self.description
+        # Most descriptions carry no salary at all; skip the regex work
+        if not ('$' in description or '€' in description or '£' in description):
+            return
+            
+        match = _SALARY_RE.search(description)
+        if match:
+            kind = match.lastgroup
+            if kind in ('range_k', 'range'):  # Range
+                min_val = float(match.group(f'{kind}_min').replace(',', ''))
+                max_val = float(match.group(f'{kind}_max').replace(',', ''))
+            else:  # Single value
+                min_val = max_val = float(match.group(f'{kind}_value').replace(',', ''))
+            if kind.endswith('_k'):
+                min_val *= 1000
+                max_val *= 1000
+            self.salary_min = min_val
+            self.salary_max = max_val
+            
         # Try to determine currency
-        currency_patterns = {
-            'USD': [r'\$', r'USD', r'US\s*dollars?'],
-            'EUR': [r'€', r'EUR', r'euros?'],
-            'GBP': [r'£', r'GBP', r'pounds?'],
-        }
-        
-        for currency, patterns in currency_patterns.items():
-            if any(re.search(pattern, desc_lower) for pattern in patterns):
-                self.salary_currency = currency
-                break
+        match = _CURRENCY_RE.search(description)
+        if match:
+            self.salary_currency = match.lastgroup
         
     def calculate_match_score(self, required_skills: Set[str], 
                             preferred_skills: Set[str],
@@ -166,43 +206,13 @@ class Job:
         
     def extract_application_method(self) -> str:
         """Extract the application method from the job description."""
-        desc_lower = self.description.lower()
-        
-        # Check for email application
-        if any(phrase in desc_lower for phrase in [
-            "apply via email",
-            "send your resume to",
-            "email us at",
-            "apply by email",
-            "@",
-            "[at]",
-            "(at)"
-        ]):
-            return "email"
-            
-        # Check for LinkedIn
-        if any(phrase in desc_lower for phrase in [
-            "apply on linkedin",
-            "linkedin.com/jobs",
-            "linkedin profile"
-        ]):
-            return "linkedin"
-            
-        # Check for company website
-        if any(phrase in desc_lower for phrase in [
-            "apply on our website",
-            "apply through our website",
-            "apply at our website",
-            "apply here:",
-            "apply at:"
-        ]):
-            return "website"
-            
-        return "unknown"
+        return detect_application_method(self.description)
 
-@dataclass
+@_slotted
+@_fast_to_dict
+@dataclass(frozen=True)
 class JobPosting:
-    """Job posting model."""
+    """Job posting model (immutable once built)."""
     
     title: str
     description: str
@@ -213,26 +223,28 @@ class JobPosting:
     def __post_init__(self):
         """Post initialization processing."""
         # Normalize fields
-        self.title = self.title.strip()
-        self.description = self.description.strip()
-        if self.email:
-            self.email = self.email.strip()
+        title = self.title.strip()
+        description = self.description.strip()
+        email = self.email.strip() if self.email else self.email
             
-        # Extract emails from title and description
-        self.extracted_emails = []
-        if self.title:
-            self.extracted_emails.extend(extract_emails_from_text(self.title))
-        if self.description:
-            self.extracted_emails.extend(extract_emails_from_text(self.description))
-        self.extracted_emails = list(set(self.extracted_emails))  # Remove duplicates
+        # Extract emails from title and description, unless the scraper
+        # already extracted them from the relevant part of the posting
+        extracted_emails = self.extracted_emails
+        if extracted_emails is None:
+            # Each field separately: the obfuscated-address patterns allow
+            # whitespace, so a match must not run from one field into the other
+            extracted_emails = extract_emails_from_text(title) + extract_emails_from_text(description)
+        extracted_emails = list(dict.fromkeys(extracted_emails))  # Remove duplicates, keep order
         
         # If no email was provided but we found one, use it
-        if not self.email and self.extracted_emails:
-            self.email = self.extracted_emails[0]
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        if not email and extracted_emails:
+            email = extracted_emails[0]
+            
+        # Frozen instance: store the normalized values directly
+        object.__setattr__(self, 'title', title)
+        object.__setattr__(self, 'description', description)
+        object.__setattr__(self, 'email', email)
+        object.__setattr__(self, 'extracted_emails', extracted_emails)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'JobPosting':
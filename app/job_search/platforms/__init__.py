@@ -1,15 +1,33 @@
 """
 Job Search Platforms
+
+Scrapers are imported lazily on first access, so using one platform
+doesn't pull in every other scraper's dependencies.
 """
-from .linkedin import LinkedInScraper
-from .hackernews import HackerNewsScraper
-from .weworkremotely import WeWorkRemotelyScraper
-from .remotive import RemotiveScraper
-from .angellist import AngelListScraper
-from .infojobs import InfoJobsScraper
-from .catho import CathoScraper
-from .glassdoor import GlassdoorScraper
-from .indeed_br import IndeedBrasilScraper
+import importlib
+
+_LAZY_SCRAPERS = {
+    'LinkedInScraper': '.linkedin',
+    'HackerNewsScraper': '.hackernews',
+    'WeWorkRemotelyScraper': '.weworkremotely',
+    'RemotiveScraper': '.remotive',
+    'AngelListScraper': '.angellist',
+    'InfoJobsScraper': '.infojobs',
+    'CathoScraper': '.catho',
+    'GlassdoorScraper': '.glassdoor',
+    'IndeedBrasilScraper': '.indeed_br',
+}
+
+def __getattr__(name):
+    if name in _LAZY_SCRAPERS:
+        module = importlib.import_module(_LAZY_SCRAPERS[name], __name__)
+        scraper = getattr(module, name)
+        globals()[name] = scraper
+        return scraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SCRAPERS))
 
 __all__ = [
     'LinkedInScraper',
@@ -21,4 +39,4 @@ __all__ = [
     'CathoScraper',
     'GlassdoorScraper',
     'IndeedBrasilScraper'
-] 
\ No newline at end of file
+]
@@ -0,0 +1,8 @@
+"""
+Description layout shared by the platform scrapers
+"""
+
+# Header lines that downstream code parses back out of JobPosting.description
+# (e.g. "Company:"), followed by the free-text body. Filled with % so the
+# string is assembled in one C-level pass.
+DESCRIPTION_TEMPLATE = "Company: %s\nLocation: %s\nSalary: %s\n\n%s"
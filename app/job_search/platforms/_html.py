@@ -0,0 +1,94 @@
+"""
+lxml helpers shared by the HTML job-card scrapers
+"""
+import io
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple, Union
+
+import lxml.html
+from cssselect import HTMLTranslator
+from lxml import etree
+
+# Listing pages are read in 64KB chunks and truncated past 2MB; lxml
+# recovers from the cut-off markup
+_CHUNK_SIZE = 65536
+MAX_PAGE_BYTES = 2_000_000
+
+async def read_page(response, limit: int = MAX_PAGE_BYTES) -> bytes:
+    """Read a response body as raw bytes, stopping once limit bytes are buffered."""
+    buf = bytearray()
+    async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) >= limit:
+            break
+    return bytes(memoryview(buf)[:limit])
+
+def parse_html(html: Union[str, bytes]) -> lxml.html.HtmlElement:
+    """Parse a listing page into an lxml tree."""
+    return lxml.html.fromstring(html)
+
+def card_matcher(css: str) -> etree.XPath:
+    """Compile a CSS selector into an XPath that tests the element itself."""
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix='self::'))
+
+def first_selector(css: str) -> etree.XPath:
+    """Compile a CSS selector into an XPath that returns only its first match.
+    
+    Drop-in for a CSSSelector passed to select_one; for a single selector
+    lxml stops walking the subtree at the first hit.
+    """
+    return etree.XPath('(%s)[1]' % HTMLTranslator().css_to_xpath(css))
+
+def find_cards(tree, matcher: etree.XPath, tags: Tuple[str, ...], limit: int) -> List[etree._Element]:
+    """Return the first limit elements of an already-parsed tree accepted by matcher.
+    
+    The document walk stops at the limit-th hit instead of collecting every
+    match on the page first.
+    """
+    return list(islice((elem for elem in tree.iter(*tags) if matcher(elem)), limit))
+
+def iter_cards(html: Union[str, bytes], matcher: etree.XPath, tags: Tuple[str, ...],
+               limit: int) -> Iterator[etree._Element]:
+    """Stream-parse a page and yield up to limit elements accepted by matcher.
+    
+    Only the outermost matches are yielded, in document order: substring
+    selectors also match a card's own parts (a "job-card__footer", say), so
+    matches inside an open card are ignored. A card is yielded whole once its
+    end tag is parsed, then cleared, together with the siblings parsed before
+    it, once the caller has consumed it. Only the card in flight is kept in
+    memory and parsing stops as soon as the limit is reached.
+    """
+    if isinstance(html, str):
+        source, encoding = io.BytesIO(html.encode('utf-8')), 'utf-8'
+    else:
+        source, encoding = io.BytesIO(html), None
+    
+    found = 0
+    card = None
+    events = etree.iterparse(source, events=('start', 'end'), tag=tags, html=True, encoding=encoding)
+    for event, elem in events:
+        if event == 'start':
+            # The start event already carries the attributes the matcher tests
+            if card is None and matcher(elem):
+                card = elem
+            continue
+        if elem is not card:
+            continue
+        card = None
+        yield elem
+        found += 1
+        if found >= limit:
+            return
+        elem.clear()
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+
+def select_one(node, selector: etree.XPath) -> Optional[lxml.html.HtmlElement]:
+    """Return the first element under node matching a precompiled selector."""
+    matches = selector(node)
+    return matches[0] if matches else None
+
+def node_text(node) -> str:
+    """Return the element's text with whitespace collapsed."""
+    return ' '.join(''.join(node.itertext()).split())
@@ -0,0 +1,67 @@
+"""
+Concurrent probing of alternative URLs/endpoints
+"""
+import asyncio
+from typing import Awaitable, Iterable, Optional, TypeVar
+
+import aiohttp
+
+T = TypeVar('T')
+
+async def first_result(probes: Iterable[Awaitable[T]]) -> Optional[T]:
+    """Run probes concurrently and return the first truthy result.
+    
+    The remaining probes are cancelled as soon as one succeeds, which
+    releases their connections back to the session pool.
+    """
+    tasks = [asyncio.ensure_future(probe) for probe in probes]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def first_result_in_order(probes: Iterable[Awaitable[T]]) -> Optional[T]:
+    """Run probes concurrently and return the truthy result listed first.
+    
+    A result is returned once every probe ahead of it has failed, so a fast
+    low-priority probe never beats a slower preferred one; the probes still
+    running are then cancelled.
+    """
+    tasks = [asyncio.ensure_future(probe) for probe in probes]
+    try:
+        for task in tasks:
+            result = await task
+            if result:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def first_live_url(session: aiohttp.ClientSession, urls: Iterable[str],
+                         timeout: float = 5) -> Optional[str]:
+    """HEAD-probe urls concurrently and return the first, in order, that answers 2xx.
+    
+    Only headers are transferred, so the page body is fetched once, from the
+    chosen URL, instead of from every candidate. urls are in priority order:
+    the probes race, but a later URL only wins once all earlier ones failed.
+    """
+    return await first_result_in_order(_probe_url(session, url, timeout) for url in urls)
+
+async def _probe_url(session: aiohttp.ClientSession, url: str, timeout: float) -> Optional[str]:
+    """Return url if it is live, else None."""
+    try:
+        async with session.head(url, allow_redirects=True, timeout=timeout) as response:
+            status = response.status
+        if status == 405:
+            # HEAD not allowed; ask for a single byte instead
+            async with session.get(url, headers={'Range': 'bytes=0-0'}, timeout=timeout) as response:
+                status = response.status
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+    return url if 200 <= status < 300 else None
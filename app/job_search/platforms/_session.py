@@ -0,0 +1,135 @@
+"""
+Shared HTTP session factory for the HTML/API scrapers
+"""
+import asyncio
+import os
+import types
+from pathlib import Path
+from typing import ClassVar, Mapping, Optional
+
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+
+from ._html import MAX_PAGE_BYTES
+
+# Scraper cache files live in the project's data/cache, or in $CACHE_DIR as
+# for the app config, whatever the working directory
+CACHE_DIR = Path(__file__).resolve().parents[3] / os.getenv("CACHE_DIR", "data/cache")
+
+# Listing pages change slowly, so responses are reused for 15 minutes across
+# searches (and across processes, since the cache lives on disk)
+CACHE_PATH = CACHE_DIR / "scrapers.sqlite"
+CACHE_TTL = 900
+
+def _fits_page_cap(response: aiohttp.ClientResponse) -> bool:
+    """Tell whether a response is small enough to be read whole into the cache.
+    
+    The cache reads the entire body before the scraper sees it, which would
+    bypass read_page's cap. Only bodies whose decoded size is known up front
+    qualify: compressed responses give the encoded length, and chunked ones
+    none at all, so those are streamed by read_page instead of cached.
+    """
+    length = response.content_length
+    return (length is not None and length <= MAX_PAGE_BYTES
+            and response.headers.get('Content-Encoding', 'identity') == 'identity')
+
+# Sessions left over from an earlier event loop, closing in the background;
+# the loop only keeps weak references to tasks
+_STALE_CLOSES = set()
+
+def new_session(headers: Mapping[str, str], total_timeout: float,
+                limit: int = 10, limit_per_host: int = 4, cached: bool = True) -> aiohttp.ClientSession:
+    """Create a session with a bounded keep-alive pool and cached DNS.
+    
+    Unless cached is False, GET responses known to fit MAX_PAGE_BYTES are
+    also kept in the on-disk response cache. Other methods always reach the
+    server: HEAD probes check that a page is live right now, and POSTs are
+    API queries.
+    """
+    options = dict(
+        headers=headers,
+        connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300,
+                                       keepalive_timeout=75, enable_cleanup_closed=True),
+        timeout=aiohttp.ClientTimeout(total=total_timeout, connect=10)
+    )
+    if not cached:
+        return aiohttp.ClientSession(**options)
+    
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    return CachedSession(
+        cache=SQLiteBackend(str(CACHE_PATH), expire_after=CACHE_TTL, allowed_methods=("GET",),
+                            filter_fn=_fits_page_cap),
+        **options
+    )
+
+async def _close_stale(session: aiohttp.ClientSession):
+    """Close a session whose event loop has ended, as far as that is possible."""
+    try:
+        # Its pooled transports belong to the dead loop and may refuse to close
+        await aiohttp.ClientSession.close(session)
+    except RuntimeError:
+        pass
+    # The cache's SQLite worker thread is not tied to a loop; left open it
+    # would keep the process from exiting
+    cache = getattr(session, 'cache', None)
+    if cache is not None:
+        await cache.close()
+
+class ScraperSession:
+    """Mixin giving a scraper one lazily created, shared HTTP session.
+    
+    Subclasses set HEADERS (and SESSION_TIMEOUT if 30s doesn't suit them);
+    the headers are frozen into a read-only mapping when the class is
+    created, since the session keeps a reference to them and no request
+    should be able to mutate them in place.
+    
+    A session only works on the event loop it was created on, so a scraper
+    reused under a new loop (a second asyncio.run()) gets a fresh one. Use
+    the scraper as an async context manager, or await close(), once done.
+    """
+    __slots__ = ()
+    
+    HEADERS: ClassVar[Mapping[str, str]] = types.MappingProxyType({})
+    SESSION_TIMEOUT: ClassVar[float] = 30
+    
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.HEADERS = types.MappingProxyType(dict(cls.HEADERS))
+    
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create the scraper's session; override to change the pool or cache."""
+        return new_session(self.HEADERS, total_timeout=self.SESSION_TIMEOUT)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use on this loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            if not self._session.closed:
+                task = loop.create_task(_close_stale(self._session))
+                _STALE_CLOSES.add(task)
+                task.add_done_callback(_STALE_CLOSES.discard)
+            self._session = None
+        if self._session is None or self._session.closed:
+            self._session = self._new_session()
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        session = self._session
+        self._session = None
+        if session is None or session.closed:
+            return
+        if self._session_loop is asyncio.get_running_loop():
+            await session.close()
+        else:
+            await _close_stale(session)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
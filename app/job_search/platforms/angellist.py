@@ -3,29 +3,90 @@ AngelList/Wellfound Job Scraper
 """
 import asyncio
 import aiohttp
-import json
-import re
+import orjson
 from typing import Dict, List, Optional
 from loguru import logger
 
+from lxml.cssselect import CSSSelector
+
+from app.utils.text_extractor import extract_emails_from_text, html_to_text
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
+from ._html import card_matcher, find_cards, node_text, parse_html, read_page, select_one
+from ._probe import first_live_url, first_result
+from ._session import ScraperSession
+
+# Card selectors for the web-scraping fallback, most specific first; each
+# group is compiled once into an XPath test applied while walking the page
+_CARD_MATCHER = card_matcher('div.job-card, div.job-item, article.job-card, div[data-testid="job-card"]')
+_GENERIC_CARD_MATCHER = card_matcher('div[class*="card"], div[class*="item"], div[class*="listing"]')
+_TESTID_CARD_MATCHER = card_matcher('div[data-testid*="job"], div[data-testid*="listing"]')
+_CARD_TAGS = ('div', 'article')
+_MAX_WEB_CARDS = 15
 
-class AngelListScraper:
+# Web cards carry no salary, so their description omits that line
+_CARD_DESCRIPTION_TEMPLATE = "Company: %s\nLocation: %s\n\nVaga encontrada no AngelList/Wellfound"
+_TITLE_SELECTOR = CSSSelector('h3.job-title, h2.job-title')
+_HEADING_SELECTOR = CSSSelector('h3, h2')
+_COMPANY_SELECTOR = CSSSelector('span.company-name, div.company-name, span.startup-name')
+_LOCATION_SELECTOR = CSSSelector('span.location, div.location')
+_LINK_SELECTOR = CSSSelector('a[href]')
+
+class AngelListScraper(ScraperSession):
     """AngelList/Wellfound job scraper."""
     
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        "Referer": "https://wellfound.com/jobs",
+    }
+    
+    # The timeout keeps one slow category from stalling the whole gather
+    SESSION_TIMEOUT = 15
+    
+    # API endpoints to probe for each category, filled in with format_map
+    _ENDPOINT_TEMPLATES = (
+        # Direct API endpoint
+        "{api}?department={cat}&remote=true&limit=20",
+        # Alternative API structure
+        "{base}/api/jobs?department={cat}&remote=true&limit=20",
+        # GraphQL endpoint
+        "{base}/api/graphql",
+        # Search endpoint
+        "{base}/api/search/jobs?q={cat}&remote=true&limit=20",
+    )
+    
+    _GRAPHQL_QUERY = """
+    query GetJobs($department: String!, $remote: Boolean!, $limit: Int!) {
+        jobs(department: $department, remote: $remote, first: $limit) {
+            edges {
+                node {
+                    id
+                    title
+                    description
+                    location
+                    remote
+                    salaryMin
+                    salaryMax
+                    startup {
+                        name
+                    }
+                }
+            }
+        }
+    }
+    """
+    # The request body serialized up to its "variables" value, built once
+    _GRAPHQL_BODY_PREFIX = orjson.dumps({"query": _GRAPHQL_QUERY})[:-1] + b',"variables":'
+    
     def __init__(self, config: Dict):
         """Initialize AngelList scraper."""
         self.config = config
         self.base_url = "https://wellfound.com"
         self.api_url = "https://wellfound.com/api/startup_jobs"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-            "Referer": "https://wellfound.com/jobs",
-        }
         
     async def search(self) -> List[JobPosting]:
         """Search for jobs on AngelList/Wellfound."""
@@ -51,19 +112,22 @@ class AngelListScraper:
             # Focus on engineering and related categories
             target_categories = ["engineering", "product", "data"]
             
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                for category in target_categories:
-                    try:
-                        category_jobs = await self._scrape_category(session, category)
-                        jobs.extend(category_jobs)
-                        logger.info(f"Found {len(category_jobs)} jobs in {category} category")
-                        
-                        # Add delay between requests
-                        await asyncio.sleep(3)
-                        
-                    except Exception as e:
-                        logger.error(f"Error scraping {category} category: {str(e)}")
-                        continue
+            # Reuse the pooled session across searches
+            session = self._get_session()
+            
+            # Scrape categories concurrently, staggering their start times
+            results = await asyncio.gather(
+                *(self._scrape_category(session, category, delay=i * 0.5)
+                  for i, category in enumerate(target_categories)),
+                return_exceptions=True
+            )
+            
+            for category, result in zip(target_categories, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scraping {category} category: {str(result)}")
+                    continue
+                jobs.extend(result)
+                logger.info(f"Found {len(result)} jobs in {category} category")
             
             logger.info(f"Found {len(jobs)} total jobs on AngelList/Wellfound")
             return jobs
@@ -72,169 +136,139 @@ class AngelListScraper:
             logger.error(f"Error searching AngelList/Wellfound: {str(e)}")
             return []
     
-    async def _scrape_category(self, session: aiohttp.ClientSession, category: str) -> List[JobPosting]:
+    async def _scrape_category(self, session: aiohttp.ClientSession, category: str,
+                               delay: float = 0) -> List[JobPosting]:
         """Scrape jobs from a specific category."""
         jobs = []
         
+        # Politeness delay before hitting the API
+        await asyncio.sleep(delay)
+        
+        # Try multiple API endpoints and approaches
+        context = {"api": self.api_url, "base": self.base_url, "cat": category}
+        endpoints_to_try = [template.format_map(context) for template in self._ENDPOINT_TEMPLATES]
+        
+        # Probe every endpoint at once and keep the first that yields jobs,
+        # so one slow endpoint doesn't delay the others. Probes swallow their
+        # own failures; anything unexpected surfaces through search()'s gather
+        jobs = await first_result(
+            self._try_endpoint(session, endpoint, category) for endpoint in endpoints_to_try
+        ) or []
+        
+        # If all APIs fail, try web scraping as fallback
+        if not jobs:
+            logger.info(f"All API endpoints failed for {category}, trying web scraping...")
+            jobs = await self._scrape_web_fallback(session, category)
+        
+        return jobs
+    
+    async def _try_endpoint(self, session: aiohttp.ClientSession, endpoint: str,
+                            category: str) -> List[JobPosting]:
+        """Fetch jobs from a single API endpoint."""
+        jobs = []
+        
         try:
-            # Try multiple API endpoints and approaches
-            endpoints_to_try = [
-                # Direct API endpoint
-                f"{self.api_url}?department={category}&remote=true&limit=20",
-                # Alternative API structure
-                f"{self.base_url}/api/jobs?department={category}&remote=true&limit=20",
-                # GraphQL endpoint
-                f"{self.base_url}/api/graphql",
-                # Search endpoint
-                f"{self.base_url}/api/search/jobs?q={category}&remote=true&limit=20"
-            ]
+            logger.debug("Trying endpoint: {}", endpoint)
             
-            for endpoint in endpoints_to_try:
-                try:
-                    logger.info(f"Trying endpoint: {endpoint}")
-                    
-                    if "graphql" in endpoint:
-                        # Try GraphQL query
-                        query = {
-                            "query": """
-                            query GetJobs($department: String!, $remote: Boolean!, $limit: Int!) {
-                                jobs(department: $department, remote: $remote, first: $limit) {
-                                    edges {
-                                        node {
-                                            id
-                                            title
-                                            description
-                                            location
-                                            remote
-                                            salaryMin
-                                            salaryMax
-                                            startup {
-                                                name
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            """,
-                            "variables": {
-                                "department": category,
-                                "remote": True,
-                                "limit": 20
-                            }
-                        }
+            if "graphql" in endpoint:
+                # Try GraphQL query; only the variables are serialized per call
+                body = self._GRAPHQL_BODY_PREFIX + orjson.dumps({
+                    "department": category,
+                    "remote": True,
+                    "limit": 20
+                }) + b"}"
+                
+                async with session.post(endpoint, data=body,
+                                        headers={"Content-Type": "application/json"}) as response:
+                    if 200 <= response.status < 300:
+                        data = orjson.loads(await response.read())
+                        if 'data' in data and 'jobs' in data['data']:
+                            for edge in data['data']['jobs']['edges']:
+                                job_data = edge['node']
+                                job = self._parse_job_data(job_data)
+                                if job:
+                                    jobs.append(job)
+                            logger.info(f"GraphQL API successful for {category}")
+            else:
+                # Try REST API
+                async with session.get(endpoint) as response:
+                    if 200 <= response.status < 300:
+                        data = orjson.loads(await response.read())
+                        
+                        # Handle different response formats
+                        if 'jobs' in data:
+                            job_list = data['jobs']
+                        elif 'data' in data:
+                            job_list = data['data']
+                        elif 'results' in data:
+                            job_list = data['results']
+                        else:
+                            job_list = data if isinstance(data, list) else []
                         
-                        async with session.post(endpoint, json=query, headers=self.headers) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                if 'data' in data and 'jobs' in data['data']:
-                                    for edge in data['data']['jobs']['edges']:
-                                        job_data = edge['node']
-                                        job = self._parse_job_data(job_data)
-                                        if job:
-                                            jobs.append(job)
-                                    logger.info(f"GraphQL API successful for {category}")
-                                    break
+                        for job_data in job_list[:20]:
+                            job = self._parse_job_data(job_data)
+                            if job:
+                                jobs.append(job)
+                        
+                        logger.info(f"REST API successful for {category}: {len(jobs)} jobs")
                     else:
-                        # Try REST API
-                        async with session.get(endpoint, headers=self.headers, timeout=15) as response:
-                            if response.status == 200:
-                                try:
-                                    data = await response.json()
-                                    
-                                    # Handle different response formats
-                                    if 'jobs' in data:
-                                        job_list = data['jobs']
-                                    elif 'data' in data:
-                                        job_list = data['data']
-                                    elif 'results' in data:
-                                        job_list = data['results']
-                                    else:
-                                        job_list = data if isinstance(data, list) else []
-                                    
-                                    for job_data in job_list[:20]:
-                                        job = self._parse_job_data(job_data)
-                                        if job:
-                                            jobs.append(job)
-                                    
-                                    logger.info(f"REST API successful for {category}: {len(jobs)} jobs")
-                                    break
-                                    
-                                except json.JSONDecodeError:
-                                    logger.warning(f"Invalid JSON response from {endpoint}")
-                                    continue
-                            else:
-                                logger.warning(f"Failed to fetch {endpoint}, status: {response.status}")
-                                
-                except Exception as e:
-                    logger.warning(f"Error with endpoint {endpoint}: {str(e)}")
-                    continue
-            
-            # If all APIs fail, try web scraping as fallback
-            if not jobs:
-                logger.info(f"All API endpoints failed for {category}, trying web scraping...")
-                jobs = await self._scrape_web_fallback(session, category)
-                
+                        logger.debug("Failed to fetch {}, status: {}", endpoint, response.status)
+                        
         except Exception as e:
-            logger.error(f"Error scraping category {category}: {str(e)}")
+            # Most endpoints are expected to fail; invalid JSON lands here too
+            logger.debug("Error with endpoint {}: {}", endpoint, e)
         
         return jobs
     
     async def _scrape_web_fallback(self, session: aiohttp.ClientSession, category: str) -> List[JobPosting]:
         """Fallback to web scraping if API fails."""
+        # Try multiple web scraping approaches
+        urls_to_try = [
+            f"{self.base_url}/jobs?department={category}&remote=true",
+            f"{self.base_url}/jobs?q={category}&remote=true",
+            f"{self.base_url}/jobs?category={category}",
+            f"{self.base_url}/jobs?search={category}"
+        ]
+        
+        # HEAD-probe every URL at once and only scrape the highest-priority live one
+        url = await first_live_url(session, urls_to_try)
+        jobs = await self._try_web_url(session, url) if url else []
+        if jobs:
+            logger.info(f"Web scraping found {len(jobs)} jobs for {category}")
+        
+        return jobs
+    
+    async def _try_web_url(self, session: aiohttp.ClientSession, url: str) -> List[JobPosting]:
+        """Scrape job cards from a single listing page."""
         jobs = []
         
         try:
-            # Try multiple web scraping approaches
-            urls_to_try = [
-                f"{self.base_url}/jobs?department={category}&remote=true",
-                f"{self.base_url}/jobs?q={category}&remote=true",
-                f"{self.base_url}/jobs?category={category}",
-                f"{self.base_url}/jobs?search={category}"
-            ]
+            logger.debug("Trying web scraping: {}", url)
             
-            for url in urls_to_try:
-                try:
-                    logger.info(f"Trying web scraping: {url}")
+            async with session.get(url) as response:
+                if 200 <= response.status < 300:
+                    html = await read_page(response)
                     
-                    async with session.get(url, headers=self.headers, timeout=15) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            
-                            # Parse HTML for job listings
-                            from bs4 import BeautifulSoup
-                            soup = BeautifulSoup(html, 'html.parser')
-                            
-                            # Look for job cards with multiple selectors
-                            job_cards = soup.find_all('div', class_='job-card') or \
-                                       soup.find_all('div', class_='job-item') or \
-                                       soup.find_all('article', class_='job-card') or \
-                                       soup.find_all('div', {'data-testid': 'job-card'}) or \
-                                       soup.find_all('div', class_=re.compile(r'card|item|listing'))
-                            
-                            if not job_cards:
-                                # Try alternative selectors
-                                job_cards = soup.find_all('div', {'data-testid': re.compile(r'job|listing')})
-                            
-                            for card in job_cards[:15]:  # Increased limit
-                                try:
-                                    job = self._parse_job_card(card)
-                                    if job:
-                                        jobs.append(job)
-                                except Exception as e:
-                                    logger.warning(f"Error parsing job card: {str(e)}")
-                                    continue
-                            
-                            # If we found jobs, break
-                            if jobs:
-                                logger.info(f"Web scraping found {len(jobs)} jobs for {category}")
-                                break
-                                
-                except Exception as e:
-                    logger.warning(f"Error scraping {url}: {str(e)}")
-                    continue
+                    # Parse HTML for job listings
+                    tree = parse_html(html)
+                    
+                    # Look for job cards with multiple selectors, stopping each
+                    # walk once enough cards are found
+                    job_cards = find_cards(tree, _CARD_MATCHER, _CARD_TAGS, _MAX_WEB_CARDS) or \
+                               find_cards(tree, _GENERIC_CARD_MATCHER, _CARD_TAGS, _MAX_WEB_CARDS)
+                    
+                    if not job_cards:
+                        # Try alternative selectors
+                        job_cards = find_cards(tree, _TESTID_CARD_MATCHER, _CARD_TAGS, _MAX_WEB_CARDS)
                     
+                    # _parse_job_card handles its own errors
+                    for card in job_cards:
+                        job = self._parse_job_card(card)
+                        if job:
+                            jobs.append(job)
+                            
         except Exception as e:
-            logger.warning(f"Web scraping fallback failed: {str(e)}")
+            logger.debug("Error scraping {}: {}", url, e)
         
         return jobs
     
@@ -242,27 +276,23 @@ class AngelListScraper:
         """Parse job information from a job card (web scraping fallback)."""
         try:
             # Extract job title
-            title_elem = card.find('h3', class_='job-title') or \
-                        card.find('h2', class_='job-title') or \
-                        card.find('h3') or \
-                        card.find('h2')
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
+            title_elem = select_one(card, _TITLE_SELECTOR)
+            if title_elem is None:
+                title_elem = select_one(card, _HEADING_SELECTOR)
+            title = node_text(title_elem) if title_elem is not None else "Unknown Position"
             
             # Extract company name
-            company_elem = card.find('span', class_='company-name') or \
-                          card.find('div', class_='company-name') or \
-                          card.find('span', class_='startup-name')
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company_elem = select_one(card, _COMPANY_SELECTOR)
+            company = node_text(company_elem) if company_elem is not None else "Unknown Company"
             
             # Extract location
-            location_elem = card.find('span', class_='location') or \
-                           card.find('div', class_='location')
-            location = location_elem.get_text(strip=True) if location_elem else "Remote"
+            location_elem = select_one(card, _LOCATION_SELECTOR)
+            location = node_text(location_elem) if location_elem is not None else "Remote"
             
             # Extract job URL
-            link_elem = card.find('a', href=True)
-            if link_elem:
-                job_url = link_elem['href']
+            link_elem = select_one(card, _LINK_SELECTOR)
+            if link_elem is not None:
+                job_url = link_elem.get('href')
                 if not job_url.startswith('http'):
                     job_url = self.base_url + job_url
             else:
@@ -271,7 +301,7 @@ class AngelListScraper:
             # Create job posting
             job = JobPosting(
                 title=title,
-                description=f"Company: {company}\nLocation: {location}\n\nVaga encontrada no AngelList/Wellfound",
+                description=_CARD_DESCRIPTION_TEMPLATE % (company, location),
                 email=None,
                 url=job_url
             )
@@ -305,17 +335,17 @@ class AngelListScraper:
             
             # Clean up description
             if description:
-                # Remove HTML tags if present
-                import re
-                description = re.sub(r'<[^>]+>', '', description)
-                description = description.strip()
+                # Remove HTML tags and entities if present
+                description = html_to_text(description).strip()
             
-            # Create job posting
+            # Create job posting; only the free-text description can hold an
+            # email, so the header lines are not scanned again
             job = JobPosting(
                 title=title,
-                description=f"Company: {company}\nLocation: {location}\nSalary: {salary}\n\n{description}",
+                description=DESCRIPTION_TEMPLATE % (company, location, salary, description),
                 email=None,  # AngelList doesn't show emails directly
-                url=job_url
+                url=job_url,
+                extracted_emails=extract_emails_from_text(description)
             )
             
             return job
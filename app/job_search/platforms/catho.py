@@ -3,27 +3,41 @@ Catho Job Scraper (Brazil)
 """
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
 from typing import Dict, List, Optional
 from loguru import logger
 
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
+from ._html import card_matcher, iter_cards, node_text, read_page, select_one
+from ._probe import first_live_url
+from ._session import ScraperSession
 
-class CathoScraper:
+# Known job-card markups, compiled to XPath once and matched while the page streams in
+_CARD_MATCHER = card_matcher('div.job-card, div.job-item, article.job-card, div[data-testid="job-card"]')
+_CARD_TAGS = ('div', 'article')
+_TITLE_SELECTOR = CSSSelector('h3.job-title')
+_COMPANY_SELECTOR = CSSSelector('span.company-name')
+_LOCATION_SELECTOR = CSSSelector('span.location')
+_LINK_SELECTOR = CSSSelector('a[href]')
+_SALARY_SELECTOR = CSSSelector('span.salary')
+
+class CathoScraper(ScraperSession):
     """Catho job scraper (Brazil)."""
     
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+    
     def __init__(self, config: Dict):
         """Initialize Catho scraper."""
         self.config = config
         self.base_url = "https://www.catho.com.br"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
         
     async def search(self) -> List[JobPosting]:
         """Search for jobs on Catho."""
@@ -46,19 +60,22 @@ class CathoScraper:
             # Focus on technology categories
             target_categories = ["tecnologia-da-informacao", "desenvolvimento", "engenharia-de-software"]
             
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                for category in target_categories:
-                    try:
-                        category_jobs = await self._scrape_category(session, category)
-                        jobs.extend(category_jobs)
-                        logger.info(f"Found {len(category_jobs)} jobs in {category} category")
-                        
-                        # Add delay between requests
-                        await asyncio.sleep(3)
-                        
-                    except Exception as e:
-                        logger.error(f"Error scraping {category} category: {str(e)}")
-                        continue
+            session = self._get_session()
+            
+            # Scrape categories concurrently; the semaphore throttles requests
+            # to the host instead of sleeping between categories
+            semaphore = asyncio.Semaphore(2)
+            results = await asyncio.gather(
+                *(self._scrape_category(session, category, semaphore) for category in target_categories),
+                return_exceptions=True
+            )
+            
+            for category, result in zip(target_categories, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scraping {category} category: {str(result)}")
+                    continue
+                jobs.extend(result)
+                logger.info(f"Found {len(result)} jobs in {category} category")
             
             logger.info(f"Found {len(jobs)} total jobs on Catho")
             return jobs
@@ -67,7 +84,8 @@ class CathoScraper:
             logger.error(f"Error searching Catho: {str(e)}")
             return []
     
-    async def _scrape_category(self, session: aiohttp.ClientSession, category: str) -> List[JobPosting]:
+    async def _scrape_category(self, session: aiohttp.ClientSession, category: str,
+                               semaphore: asyncio.Semaphore) -> List[JobPosting]:
         """Scrape jobs from a specific category."""
         jobs = []
         
@@ -81,80 +99,76 @@ class CathoScraper:
                 f"{self.base_url}/busca/"
             ]
             
-            html = None
-            for url in urls_to_try:
-                logger.info(f"Trying URL: {url}")
-                try:
-                    async with session.get(url, timeout=10) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            logger.info(f"Successfully fetched: {url}")
-                            break
-                        else:
-                            logger.warning(f"Failed to fetch {url}, status: {response.status}")
-                except Exception as e:
-                    logger.warning(f"Error fetching {url}: {str(e)}")
-                    continue
+            # HEAD-probe every URL at once, but download the highest-priority
+            # live one so the page chosen does not depend on response times
+            async with semaphore:
+                url = await first_live_url(session, urls_to_try)
+                html = await self._fetch_page(session, url) if url else None
             
             if not html:
                 logger.warning("All Catho URLs failed")
                 return jobs
-                
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find job listings - try different selectors
-                job_cards = soup.find_all('div', class_='job-card')
-                if not job_cards:
-                    job_cards = soup.find_all('div', class_='job-item')
-                if not job_cards:
-                    job_cards = soup.find_all('article', class_='job-card')
-                if not job_cards:
-                    job_cards = soup.find_all('div', {'data-testid': 'job-card'})
-                
-                logger.info(f"Found {len(job_cards)} job cards")
-                
-                for card in job_cards[:10]:  # Limit to 10 jobs per category
-                    try:
-                        job_data = self._parse_job_card(card)
-                        if job_data:
-                            jobs.append(job_data)
-                            
-                    except Exception as e:
-                        logger.error(f"Error parsing job card: {str(e)}")
-                        continue
-                
+            
+            # Stream the job cards out of the page; parsing stops after 10 per category
+            for card in iter_cards(html, _CARD_MATCHER, _CARD_TAGS, limit=10):
+                try:
+                    job_data = self._parse_job_card(card)
+                    if job_data:
+                        jobs.append(job_data)
+                        
+                except Exception as e:
+                    logger.error(f"Error parsing job card: {str(e)}")
+                    continue
+            
+            logger.info(f"Found {len(jobs)} job cards")
+            
         except Exception as e:
             logger.error(f"Error scraping category {category}: {str(e)}")
         
         return jobs
     
+    async def _fetch_page(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """Fetch a single listing page, returning None on failure."""
+        logger.info(f"Trying URL: {url}")
+        try:
+            async with session.get(url, timeout=10) as response:
+                if 200 <= response.status < 300:
+                    html = await read_page(response)
+                    logger.info(f"Successfully fetched: {url}")
+                    return html
+                else:
+                    logger.warning(f"Failed to fetch {url}, status: {response.status}")
+        except Exception as e:
+            logger.warning(f"Error fetching {url}: {str(e)}")
+        return None
+    
     def _parse_job_card(self, card) -> Optional[JobPosting]:
         """Parse job information from a job card."""
         try:
             # Extract job title
-            title_elem = card.find('h3', class_='job-title')
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
+            title_elem = select_one(card, _TITLE_SELECTOR)
+            title = node_text(title_elem) if title_elem is not None else "Unknown Position"
             
             # Extract company name
-            company_elem = card.find('span', class_='company-name')
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company_elem = select_one(card, _COMPANY_SELECTOR)
+            company = node_text(company_elem) if company_elem is not None else "Unknown Company"
             
             # Extract location
-            location_elem = card.find('span', class_='location')
-            location = location_elem.get_text(strip=True) if location_elem else "Remote"
+            location_elem = select_one(card, _LOCATION_SELECTOR)
+            location = node_text(location_elem) if location_elem is not None else "Remote"
             
             # Extract job URL
-            link_elem = card.find('a', href=True)
-            job_url = self.base_url + link_elem['href'] if link_elem else ""
+            link_elem = select_one(card, _LINK_SELECTOR)
+            job_url = self.base_url + link_elem.get('href') if link_elem is not None else ""
             
             # Extract salary if available
-            salary_elem = card.find('span', class_='salary')
-            salary = salary_elem.get_text(strip=True) if salary_elem else ""
+            salary_elem = select_one(card, _SALARY_SELECTOR)
+            salary = node_text(salary_elem) if salary_elem is not None else ""
             
             # Create job posting
             job = JobPosting(
                 title=title,
-                description=f"Company: {company}\nLocation: {location}\nSalary: {salary}\n\nVaga encontrada no Catho",
+                description=DESCRIPTION_TEMPLATE % (company, location, salary, "Vaga encontrada no Catho"),
                 email=None,  # Catho doesn't show emails directly
                 url=job_url
             )
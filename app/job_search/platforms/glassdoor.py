@@ -1,30 +1,43 @@
 import aiohttp
 import asyncio
 import logging
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import re
-from datetime import datetime
+from typing import List, Dict, Any, Optional
+from lxml.cssselect import CSSSelector
 
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
+from ._html import card_matcher, iter_cards, node_text, read_page, select_one
+from ._session import ScraperSession
 
 logger = logging.getLogger(__name__)
 
-class GlassdoorScraper:
+# Selectors used to locate job cards and their fields, compiled to XPath once
+_CARD_MATCHER = card_matcher('div[class*="job-search-card"], div[class*="job-listing"]')
+_CARD_TAGS = ('div',)
+_TITLE_LINK_SELECTOR = CSSSelector('a[class*="title"]')
+_HEADING_SELECTOR = CSSSelector('h2, h3')
+_COMPANY_LINK_SELECTOR = CSSSelector('a[class*="company"], a[class*="employer"]')
+_COMPANY_SPAN_SELECTOR = CSSSelector('span[class*="company"], span[class*="employer"]')
+_LINK_SELECTOR = CSSSelector('a[href]')
+_LOCATION_SELECTOR = CSSSelector('span[class*="location"], span[class*="city"]')
+_SALARY_SELECTOR = CSSSelector('span[class*="salary"], span[class*="compensation"]')
+
+class GlassdoorScraper(ScraperSession):
     """Scraper for Glassdoor job postings."""
     
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+    
     def __init__(self, config=None):
         self.config = config or {}
         self.base_url = "https://www.glassdoor.com"
         self.search_url = "https://www.glassdoor.com/Job"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
         
         # Technology job categories
         self.categories = [
@@ -48,30 +61,36 @@ class GlassdoorScraper:
         logger.info("Searching Glassdoor jobs...")
         all_jobs = []
         
-        # Search in multiple categories
-        for category in self.categories[:5]:  # Limit to 5 categories for performance
-            try:
-                jobs = await self._scrape_category(category)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs in {category} category")
-                
-                # Add delay between categories
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error scraping category {category}: {str(e)}")
+        # Search in multiple categories concurrently; the semaphore throttles
+        # requests to the host instead of sleeping between categories
+        categories = self.categories[:5]  # Limit to 5 categories for performance
+        session = self._get_session()
+        semaphore = asyncio.Semaphore(2)
+        results = await asyncio.gather(
+            *(self._scrape_category(session, category, semaphore) for category in categories),
+            return_exceptions=True
+        )
+        
+        for category, result in zip(categories, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping category {category}: {str(result)}")
                 continue
+            all_jobs.extend(result)
+            logger.info(f"Found {len(result)} jobs in {category} category")
         
         # Remove duplicates based on URL
-        unique_jobs = {}
+        unique_jobs = []
+        seen_urls = set()
         for job in all_jobs:
-            if job.url not in unique_jobs:
-                unique_jobs[job.url] = job
+            if job.url not in seen_urls:
+                unique_jobs.append(job)
+                seen_urls.add(job.url)
         
         logger.info(f"Found {len(unique_jobs)} total unique jobs on Glassdoor")
-        return list(unique_jobs.values())
+        return unique_jobs
     
-    async def _scrape_category(self, category: str) -> List[JobPosting]:
+    async def _scrape_category(self, session: aiohttp.ClientSession, category: str,
+                               semaphore: asyncio.Semaphore) -> List[JobPosting]:
         """Scrape jobs from a specific category."""
         jobs = []
         
@@ -80,19 +99,16 @@ class GlassdoorScraper:
             search_url = f"{self.search_url}/{category}-jobs"
             logger.info(f"Scraping category: {search_url}")
             
-            async with aiohttp.ClientSession(headers=self.headers) as session:
+            async with semaphore:
                 async with session.get(search_url) as response:
-                    if response.status != 200:
+                    if not 200 <= response.status < 300:
                         logger.warning(f"Failed to fetch {search_url}, status: {response.status}")
                         return jobs
                     
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Find job listings
-                    job_cards = soup.find_all('div', class_=re.compile(r'job-search-card|job-listing'))
+                    html = await read_page(response)
                     
-                    for card in job_cards[:20]:  # Limit to 20 jobs per category
+                    # Stream the job cards out of the page; parsing stops after 20 per category
+                    for card in iter_cards(html, _CARD_MATCHER, _CARD_TAGS, limit=20):
                         try:
                             job = self._parse_job_card(card, category)
                             if job:
@@ -106,53 +122,46 @@ class GlassdoorScraper:
         
         return jobs
     
-    def _parse_job_card(self, card, category: str) -> JobPosting:
+    def _parse_job_card(self, card, category: str) -> Optional[JobPosting]:
         """Parse a job card to extract job information."""
         try:
             # Extract job title
-            title_elem = card.find('a', class_=re.compile(r'title|job-title'))
-            if not title_elem:
-                title_elem = card.find('h2') or card.find('h3')
+            title_elem = select_one(card, _TITLE_LINK_SELECTOR)
+            if title_elem is None:
+                title_elem = select_one(card, _HEADING_SELECTOR)
             
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
+            title = node_text(title_elem) if title_elem is not None else "Unknown Position"
             
             # Extract company name
-            company_elem = card.find('a', class_=re.compile(r'company|employer'))
-            if not company_elem:
-                company_elem = card.find('span', class_=re.compile(r'company|employer'))
+            company_elem = select_one(card, _COMPANY_LINK_SELECTOR)
+            if company_elem is None:
+                company_elem = select_one(card, _COMPANY_SPAN_SELECTOR)
             
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company = node_text(company_elem) if company_elem is not None else "Unknown Company"
             
             # Extract job URL
-            url_elem = card.find('a', href=True)
-            if url_elem and url_elem.get('href'):
-                url = url_elem['href']
+            url_elem = select_one(card, _LINK_SELECTOR)
+            if url_elem is not None and url_elem.get('href'):
+                url = url_elem.get('href')
                 if not url.startswith('http'):
                     url = self.base_url + url
             else:
                 url = f"{self.base_url}/job/{category}"
             
             # Extract location
-            location_elem = card.find('span', class_=re.compile(r'location|city'))
-            location = location_elem.get_text(strip=True) if location_elem else "Remote"
+            location_elem = select_one(card, _LOCATION_SELECTOR)
+            location = node_text(location_elem) if location_elem is not None else "Remote"
             
             # Extract salary (if available)
-            salary_elem = card.find('span', class_=re.compile(r'salary|compensation'))
-            salary = salary_elem.get_text(strip=True) if salary_elem else ""
+            salary_elem = select_one(card, _SALARY_SELECTOR)
+            salary = node_text(salary_elem) if salary_elem is not None else ""
             
             # Create job posting
             job = JobPosting(
                 title=title,
-                company=company,
-                location=location,
-                url=url,
-                platform="Glassdoor",
-                category=category,
-                salary=salary,
-                posted_date=datetime.now().isoformat(),
-                description="",
-                requirements="",
-                benefits=""
+                description=DESCRIPTION_TEMPLATE % (company, location, salary, "Vaga encontrada no Glassdoor"),
+                email=None,  # Glassdoor doesn't show emails directly
+                url=url
             )
             
             return job
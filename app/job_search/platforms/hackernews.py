@@ -1,52 +1,615 @@
 """
-HackerNews Job Scraper
+HackerNews Job Scraper ("Ask HN: Who is hiring?" threads)
 """
 import asyncio
+import functools
+import html
+import random
 import re
-from typing import Dict, List, Optional
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+import aiohttp
+import orjson
 from loguru import logger
 
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
+from ._session import CACHE_DIR, ScraperSession, new_session
+
+# Comment markup: HN separates paragraphs with <p> and escapes most punctuation
+_PARAGRAPH_RE = re.compile(r'<p>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Salary formats seen in the threads, as (pattern, currency, multiplier).
+# Like the patterns below, save _LOCATION_RE, they run on lowercased text,
+# so none of them carries re.IGNORECASE
+_SALARY_FORMATS = (
+    # $120k - $150k
+    (r'\$\s?(\d{2,3})\s?k\s?(?:-|–|to)\s?\$?\s?(\d{2,3})\s?k', 'USD', 1000),
+    # $120,000 - $150,000
+    (r'\$\s?(\d{2,3}(?:,\d{3})+)\s?(?:-|–|to)\s?\$?\s?(\d{2,3}(?:,\d{3})+)', 'USD', 1),
+    # $8,000/month
+    (r'\$\s?(\d{1,2},\d{3}|\d{4,5})\s?(?:/|per\s)\s?month', 'USD', 12),
+    # $150k
+    (r'\$\s?(\d{2,3})\s?k\b', 'USD', 1000),
+    # €60k - €80k
+    (r'€\s?(\d{2,3})\s?k\s?(?:-|–|to)\s?€?\s?(\d{2,3})\s?k', 'EUR', 1000),
+    # 60k - 80k EUR
+    (r'(\d{2,3})\s?k\s?(?:-|–|to)\s?(\d{2,3})\s?k\s?(?:€|eur)', 'EUR', 1000),
+)
+
+# All formats as one alternation, so a line is scanned once. Each branch ends
+# in an empty group named after its format, which match.lastgroup reports
+_SALARY_RE = re.compile(
+    '|'.join('%s(?P<salary%d>)' % (pattern, i) for i, (pattern, _, _) in enumerate(_SALARY_FORMATS))
+)
+_SALARY_UNITS = {
+    'salary%d' % i: (currency, multiplier) for i, (_, currency, multiplier) in enumerate(_SALARY_FORMATS)
+}
+
+_TITLE_RE = re.compile(
+    r'\b(?:engineer|developer|programmer|scientist|architect|sre'
+    r'|designer|manager|analyst|lead|devops)s?\b'
+)
+
+# Location phrasings as one alternation; the named group that matched
+# (match.lastgroup) holds the location. It runs on the original line, since
+# lowercasing can change a line's length ("İ" becomes two characters) and
+# the location is reported in its original case
+_LOCATION_RE = re.compile(
+    r'\blocation:?\s*(?P<explicit>[^|\n.]+)'
+    r'|\b(?:based|located|onsite|on-site)\s+in\s+(?P<based>[^|\n.]+)'
+    r'|\b(?P<remote>remote(?:\s*\([^)]*\))?)',
+    re.IGNORECASE
+)
+
+# Line kinds produced by _tokenize_lines
+HEADER, BULLET, TEXT = 'header', 'bullet', 'text'
+
+# Lowercased openings of a line that starts a requirements block
+_REQ_HEADER_PREFIXES = (
+    'requirement', 'qualification',
+    "what we're looking for", 'what we are looking for', "we're looking for", 'we are looking for',
+    'you have', "you'll have", 'you will have',
+    'must have', 'must-have',
+    'skills', 'required skills',
+    'stack', 'tech stack', 'our stack', 'our tech stack',
+)
+
+# Bullet markers plus the blanks around them; stripped lines never start
+# with a blank, so the set also serves the bullet test
+_BULLET_CHARS = '•-*→▸›» \t'
+
+# Requirements stated inline in a sentence, as one alternation; the named
+# group that matched (match.lastgroup) holds the requirement
+_REQ_RE = re.compile(
+    r'(?P<years>\d+\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience[^.]*)'
+    r'|\b(?:must|should)\s+(?:have|know)\s+(?P<must>[^.]+)'
+    r'|\b(?:strong|solid|deep)\s+(?:knowledge|understanding)\s+of\s+(?P<knowledge>[^.]+)'
+)
+
+# Separators between the items of an inline list ("python, go and postgresql").
+# "/" is left alone, since it belongs to names like "ci/cd"
+_LIST_SEP_RE = re.compile(r'\s*[,;&]\s*(?:(?:and|or)\s+)?|\s+(?:and/or|and|or)\s+')
+
+# Phrases that introduce the technologies a team works with, fused into one
+# alternation so a single finditer pass over a line yields every match
+_TECH_RE = re.compile(
+    r'\b(?:using\s'
+    r'|with\s'
+    r'|experience\s+(?:with|in)\s'
+    r'|knowledge\s+of\s'
+    r'|proficiency\s+in\s'
+    r'|familiar(?:ity)?\s+with\s'
+    r'|expertise\s+in\s'
+    r'|background\s+in\s'
+    r'|built\s+(?:with|on)\s'
+    r'|(?:tech\s+)?stack\s*(?:is\b|:))'
+    r'\s*(?P<val>[^.]+)'
+)
+
+# Words at least one of the location, salary, requirement or tech-phrase
+# patterns needs; lines without any skip that whole battery
+_TRIGGER_RE = re.compile(
+    r'[$€]|eur|requirement|qualification|looking for|have|skills|stack'
+    r'|location|based|located|onsite|on-site|remote'
+    r'|experience|must|should|knowledge|understanding|using|with'
+    r'|proficiency|familiar|expertise|background|built'
+)
+
+TECH_KEYWORDS = (
+    'python', 'django', 'flask', 'fastapi', 'java', 'kotlin', 'scala', 'go', 'golang',
+    'rust', 'c++', 'c#', '.net', 'ruby', 'rails', 'php', 'laravel', 'elixir', 'erlang',
+    'haskell', 'clojure', 'swift', 'objective-c', 'javascript', 'typescript', 'node',
+    'node.js', 'react', 'react native', 'vue', 'angular', 'svelte', 'next.js', 'graphql',
+    'rest', 'grpc', 'postgres', 'postgresql', 'mysql', 'sqlite', 'mongodb', 'redis',
+    'elasticsearch', 'kafka', 'rabbitmq', 'spark', 'airflow', 'dbt', 'snowflake',
+    'bigquery', 'aws', 'gcp', 'azure', 'docker', 'kubernetes', 'terraform', 'ansible',
+    'linux', 'ci/cd', 'pytorch', 'tensorflow', 'llm', 'machine learning', 'nlp',
+    'computer vision', 'sql', 'nosql', 'microservices', 'serverless', 'webassembly',
+    'ios', 'android', 'flutter', 'unity', 'embedded', 'fpga', 'cuda',
+)
+
+def _trie_pattern(words) -> str:
+    """Build a regex alternation of words, factored into a prefix trie.
+    
+    re tries the branches of a flat alternation one by one at every
+    position; factored by prefix, only the branch starting with the current
+    character is followed, much like a DFA. Where one word is a prefix of
+    another the longer one is tried first.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = None  # a word ends here
+    
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:%s)?' % '|'.join(branches)
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:%s)' % '|'.join(branches)
+    
+    return build(trie)
+
+# All keywords as one trie-shaped alternation, so the regex engine scans the
+# text once for every keyword and "postgresql" wins over "postgres".
+# Keywords must stand alone ("go" is not found in "google"); lookarounds
+# rather than \b, since "c++" and "c#" end in non-word characters
+_TECH_KEYWORDS_RE = re.compile(r'(?<!\w)(?:' + _trie_pattern(TECH_KEYWORDS) + r')(?!\w)')
+
+# Candidate requirements containing these are sentence fragments, not skills
+SKIP_PHRASES = (
+    'we are', "we're", 'you will', "you'll", 'please', 'apply',
+    'email', 'contact', 'our team', 'our company', 'join us', 'benefits', 'equity',
+    'salary', 'visa', 'office', 'hiring', 'great', 'fun', 'competitive',
+)
+
+# One scan for every skip phrase; phrases match whole words (so "fun" does not
+# reject "functional"), links match anywhere
+_SKIP_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, SKIP_PHRASES)) + r')\b|http|www\.'
+)
+
+_DEFAULT_KEYWORDS = ['software engineer', 'developer', 'python', 'react']
 
-class HackerNewsScraper:
-    """HackerNews job scraper."""
+# Job posts rarely run past ~80 lines; later lines of a longer comment are
+# not parsed line by line (the keyword scan still covers the whole text)
+_MAX_PARSED_LINES = 200
+
+@functools.lru_cache(maxsize=32)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Pattern:
+    """Compile search keywords into one lowercase alternation, once per keyword set."""
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+def _tokenize_lines(lines: List[str], lines_lower: List[str]) -> Iterator[Tuple[str, str, str]]:
+    """Classify each non-empty line in a single left-to-right pass.
+    
+    lines_lower holds the same lines lowercased. Yields (kind, line,
+    lowercased line) where kind is HEADER for a line opening a requirements
+    block, BULLET for a list item and TEXT otherwise. Only string prefix and
+    first-character tests are used, no regex.
+    """
+    for line, line_lower in zip(lines, lines_lower):
+        line = line.strip()
+        if not line:
+            continue
+        line_lower = line_lower.strip()
+        if line_lower.startswith(_REQ_HEADER_PREFIXES):
+            yield HEADER, line, line_lower
+        elif line[0] in _BULLET_CHARS:
+            yield BULLET, line, line_lower
+        else:
+            yield TEXT, line, line_lower
+
+# A thread gets new posts slowly; parsed results are reused for an hour
+_RESULTS_TTL = 3600
+
+# Algolia answers rate limiting and transient failures with these; such
+# requests are retried with exponentially growing, jittered waits
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_DELAY = 1.0
+
+# Hiring thread ids by month, kept on disk so a new process skips the thread
+# lookup for any month it has already seen
+THREADS_PATH = CACHE_DIR / "hn_threads.json"
+
+def _load_threads() -> Dict[str, str]:
+    """Read the month -> thread id map saved by earlier runs."""
+    try:
+        return orjson.loads(THREADS_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+def _save_threads(threads: Dict[str, str]):
+    """Write the month -> thread id map for later runs."""
+    try:
+        THREADS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        THREADS_PATH.write_bytes(orjson.dumps(threads))
+    except OSError as e:
+        logger.debug("Could not save HackerNews thread ids: {}", e)
+
+def _clean_html(text: str) -> str:
+    """Turn HN comment markup into plain text, one paragraph per line.
+    
+    HN emits a handful of inline tags and escapes every '<' in the text
+    itself, so two substitutions strip the markup exactly; a full lxml
+    parse of each comment gives the same text about four times slower.
+    """
+    return html.unescape(_TAG_RE.sub('', _PARAGRAPH_RE.sub('\n', text)))
+
+class HackerNewsScraper(ScraperSession):
+    """HackerNews "Who is hiring?" job scraper."""
+    
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+        "Accept": "application/json",
+    }
+    
+    __slots__ = ('config', 'base_url', 'search_url', '_threads', '_cache', '_posts_thread', '_posts',
+                 '_session', '_session_loop')
     
     def __init__(self, config: Dict):
         """Initialize HackerNews scraper."""
-        self.config = config
+        self.config = config or {}
+        self.base_url = "https://news.ycombinator.com"
+        self.search_url = "https://hn.algolia.com/api/v1/search_by_date"
+        # "%B %Y" month -> its hiring thread id; a thread never changes id,
+        # so only months without a thread yet are looked up again
+        self._threads: Dict[str, str] = _load_threads()
+        # (thread_id, sorted keywords) -> (monotonic timestamp, jobs)
+        self._cache: Dict[Tuple, Tuple[float, List[JobPosting]]] = {}
+        # Posts parsed from the current thread, whatever the keywords:
+        # (comment id, updated_at) -> job
+        self._posts_thread: Optional[str] = None
+        self._posts: Dict[Tuple, JobPosting] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create the session used for the thread lookup and the comment pages."""
+        # One keep-alive pool for both; Algolia takes every page at once, so
+        # the connector is the only bound on the fan-out. Parsed results have
+        # their own cache (_RESULTS_TTL), so responses aren't cached on disk
+        return new_session(self.HEADERS, total_timeout=self.SESSION_TIMEOUT, limit=50, limit_per_host=50,
+                           cached=False)
+    
+    async def search(self, keywords: Optional[List[str]] = None) -> List[JobPosting]:
+        """Search the current "Who is hiring?" thread for matching job posts."""
+        if keywords is None:
+            keywords = self.config.get('search', {}).get('keywords') or _DEFAULT_KEYWORDS
+        if not keywords:
+            return []
         
-    async def search(self) -> List[JobPosting]:
-        """Search for jobs on HackerNews."""
         try:
             logger.info("Searching HackerNews jobs...")
             
-            # For now, return mock data since we don't have real HackerNews access
-            # In a real implementation, this would scrape the "Who is Hiring" threads
-            
-            mock_jobs = [
-                JobPosting(
-                    title="Senior Software Engineer",
-                    description="We are a fast-growing startup looking for a Senior Software Engineer with experience in React, Node.js, and Python. Remote work available.",
-                    email="jobs@startup.com",
-                    url="https://news.ycombinator.com/item?id=123456"
-                ),
-                JobPosting(
-                    title="Full Stack Developer",
-                    description="Join our team as a Full Stack Developer. We need someone with strong React and Python skills. Competitive salary and benefits.",
-                    email="careers@techcompany.com",
-                    url="https://news.ycombinator.com/item?id=123457"
-                ),
-                JobPosting(
-                    title="Backend Engineer",
-                    description="We are seeking a Backend Engineer with experience in Python, Django, and PostgreSQL. Knowledge of AWS is a plus.",
-                    email="hr@datacompany.com",
-                    url="https://news.ycombinator.com/item?id=123458"
-                )
+            thread_id = await self.get_latest_who_is_hiring_thread()
+            if not thread_id:
+                logger.warning("No current 'Who is hiring?' thread found on HackerNews")
+                return []
+            
+            if thread_id != self._posts_thread:
+                self._posts_thread = thread_id
+                self._posts = {}
+            
+            cache_key = (thread_id, tuple(sorted(keywords)))
+            cached = self._cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _RESULTS_TTL:
+                logger.info(f"Found {len(cached[1])} jobs on HackerNews (cached)")
+                return list(cached[1])
+            
+            # One alternation scans each comment once for every keyword
+            keyword_re = _keyword_matcher(cache_key[1])
+            parent_id = int(thread_id)
+            
+            # The thread's comments come from Algolia in pages of up to 1000,
+            # text included; fetch the first page to learn how many there are
+            session = self._get_session()
+            first_page = await self._fetch_comment_page(session, thread_id, 0)
+            if first_page is None:
+                return []
+            # Start the other pages downloading before parsing anything
+            pending = [
+                asyncio.ensure_future(self._fetch_comment_page(session, thread_id, page))
+                for page in range(1, first_page.get('nbPages', 1))
             ]
             
-            logger.info(f"Found {len(mock_jobs)} jobs on HackerNews")
-            return mock_jobs
+            # Pages are parsed as they arrive, so each page's raw hits can be
+            # freed before the next one is handled. The worker threads only
+            # read this snapshot of the parsed posts
+            known = dict(self._posts)
+            jobs = await self._parse_page(first_page, parent_id, keyword_re, known)
+            del first_page
+            for next_page in asyncio.as_completed(pending):
+                jobs += await self._parse_page(await next_page, parent_id, keyword_re, known)
             
+            # Expired results are dropped as new ones come in, so the cache
+            # only holds keyword sets searched within the last _RESULTS_TTL
+            now = time.monotonic()
+            self._cache = {key: entry for key, entry in self._cache.items() if now - entry[0] < _RESULTS_TTL}
+            self._cache[cache_key] = (now, jobs)
+            logger.info(f"Found {len(jobs)} jobs on HackerNews")
+            return list(jobs)
+        
         except Exception as e:
             logger.error(f"Error searching HackerNews: {str(e)}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    async def get_latest_who_is_hiring_thread(self) -> Optional[str]:
+        """Return the item id of the latest "Who is hiring?" thread.
+        
+        The current and previous month are looked up concurrently, so early
+        in a month, before the new thread is posted, last month's is used
+        without an extra round trip.
+        """
+        now = datetime.now()
+        current_month = now.strftime("%B %Y")
+        previous_month = (now.replace(day=1) - timedelta(days=1)).strftime("%B %Y")
+        
+        if current_month in self._threads:
+            return self._threads[current_month]
+        
+        current, previous = await asyncio.gather(
+            self._find_thread(current_month), self._find_thread(previous_month)
+        )
+        return current or previous
+    
+    async def _find_thread(self, month: str) -> Optional[str]:
+        """Return the item id of the "Who is hiring?" thread for a "%B %Y" month."""
+        if month in self._threads:
+            return self._threads[month]
+        
+        params = {
+            'query': f'Ask HN: Who is hiring? ({month})',
+            'tags': 'story,author_whoishiring',
+        }
+        
+        try:
+            data = await self._search_api(self._get_session(), params, "HackerNews thread search")
+            if data is None:
+                return None
+            
+            # Prefer the most upvoted match in case of reposts
+            matches = [
+                hit for hit in data.get('hits', [])
+                if 'who is hiring' in hit.get('title', '').lower() and month in hit.get('title', '')
+            ]
+            if matches:
+                thread_id = max(matches, key=lambda hit: hit.get('points') or 0)['objectID']
+                self._threads[month] = thread_id
+                _save_threads(self._threads)
+                return thread_id
+        
+        except Exception as e:
+            logger.error(f"Error finding HackerNews hiring thread: {str(e)}")
+        
+        return None
+    
+    async def _fetch_comment_page(self, session: aiohttp.ClientSession, thread_id: str,
+                                  page: int) -> Optional[Dict]:
+        """Fetch one page of a thread's comments from Algolia."""
+        params = {
+            'tags': f'comment,story_{thread_id}',
+            'hitsPerPage': 1000,
+            'page': page,
+        }
+        try:
+            return await self._search_api(session, params, f"HackerNews comments page {page}")
+        except Exception as e:
+            logger.warning(f"Error fetching HackerNews comments page {page}: {str(e)}")
+            return None
+    
+    async def _search_api(self, session: aiohttp.ClientSession, params: Dict,
+                          what: str) -> Optional[Dict]:
+        """GET the Algolia search endpoint and decode the JSON body.
+        
+        Rate limiting, transient server errors and connection failures are
+        retried up to _RETRY_ATTEMPTS times, waiting as the server's
+        Retry-After asks or else exponentially longer with jitter. Returns
+        None on any other status or once the attempts run out.
+        """
+        for attempt in range(_RETRY_ATTEMPTS):
+            delay = _RETRY_DELAY * 2 ** attempt + random.random()
+            try:
+                async with session.get(self.search_url, params=params) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    if response.status not in _RETRY_STATUSES:
+                        logger.warning(f"{what} failed, status: {response.status}")
+                        return None
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = float(retry_after)
+                    logger.debug("{} got status {}, attempt {}", what, response.status, attempt + 1)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug("{} failed ({}), attempt {}", what, e, attempt + 1)
+            
+            if attempt + 1 < _RETRY_ATTEMPTS:
+                await asyncio.sleep(delay)
+        
+        logger.warning(f"{what} failed after {_RETRY_ATTEMPTS} attempts")
+        return None
+    
+    async def _parse_page(self, page: Optional[Dict], parent_id: int, keyword_re: Pattern,
+                          known: Dict[Tuple, JobPosting]) -> List[JobPosting]:
+        """Return the job postings in a comment page, remembering new posts.
+        
+        Parsing is CPU-bound, so it runs in a worker thread: the other pages
+        (and the other scrapers) keep downloading meanwhile. The thread only
+        returns what it parsed; self._posts is updated here, on the loop.
+        """
+        parsed = await asyncio.to_thread(self._page_jobs, page, parent_id, keyword_re, known)
+        return [self._posts.setdefault(post_key, job) for post_key, job in parsed]
+    
+    def _page_jobs(self, page: Optional[Dict], parent_id: int, keyword_re: Pattern,
+                   known: Dict[Tuple, JobPosting]) -> List[Tuple[Tuple, JobPosting]]:
+        """Return (post key, job posting) for each matching top-level comment in a page."""
+        jobs = []
+        for hit in (page or {}).get('hits', []):
+            if hit.get('parent_id') != parent_id:
+                continue  # a reply, not a job post
+            job = self._process_comment(hit, keyword_re, known)
+            if job:
+                jobs.append(job)
+        return jobs
+    
+    def _process_comment(self, hit: Dict, keyword_re: Pattern,
+                         known: Dict[Tuple, JobPosting]) -> Optional[Tuple[Tuple, JobPosting]]:
+        """Turn one top-level comment (an Algolia hit) into (post key, job posting).
+        
+        keyword_re matches any of the lowercased search keywords; comments
+        without a match are skipped. known maps post keys to the postings
+        already parsed, so a post is parsed once per edit and reused by later
+        searches with other keywords. It is only read, never updated.
+        """
+        comment_id = hit.get('objectID')
+        
+        # Strip the markup and lowercase once; the parsers below all work on
+        # plain text and match against the lowercased copy
+        text = _clean_html(hit.get('comment_text') or '')
+        text_lower = text.lower()
+        if not keyword_re.search(text_lower):
+            return None
+        
+        post_key = (comment_id, hit.get('updated_at'))
+        job = known.get(post_key)
+        if job is None:
+            job = self._build_job(comment_id, text, text_lower)
+        return post_key, job
+    
+    def _build_job(self, comment_id: str, text: str, text_lower: str) -> JobPosting:
+        """Parse a cleaned comment into a job posting."""
+        details = self._parse_job_details(text, text_lower)
+        
+        salary = ""
+        if details['salary_min'] is not None:
+            salary = f"{details['salary_min']:,} - {details['salary_max']:,} {details['currency']}"
+        
+        description = details['text']
+        if details['requirements']:
+            description += "\n\nRequirements: " + ", ".join(details['requirements'])
+        
+        return JobPosting(
+            title=details['title'],
+            description=DESCRIPTION_TEMPLATE % (details['company'], details['location'], salary, description),
+            email=None,  # Picked up from the comment text by JobPosting
+            url=f"{self.base_url}/item?id={comment_id}"
+        )
+    
+    def _parse_job_details(self, text: str, text_lower: Optional[str] = None) -> Dict:
+        """Extract company, title, location, salary and requirements from plain comment text.
+        
+        text_lower is text.lower(), when the caller already has it.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        lines = text.split('\n')
+        lines_lower = text_lower.split('\n')
+        
+        details = {
+            'text': text.strip(),
+            'company': 'Unknown Company',
+            'title': 'Unknown Position',
+            'location': 'Remote',
+            'salary_min': None,
+            'salary_max': None,
+            'currency': None,
+            'requirements': [],
+        }
+        
+        # Posts conventionally open with "Company | Role | Location | ..."
+        # The lowercased header splits into the same parts; match on those
+        # and report the original-case text
+        header = lines[0].split('|')
+        header_lower = lines_lower[0].split('|')
+        if header[0].strip():
+            details['company'] = header[0].strip()[:100]
+        for part, part_lower in zip(header[1:], header_lower[1:]):
+            if _TITLE_RE.search(part_lower):
+                details['title'] = part.strip()[:100]
+                break
+        
+        location_found = False
+        in_requirements = False
+        # Every normalized candidate -> whether it was kept, in first-seen
+        # order; a repeated candidate is looked up instead of judged again
+        verdicts: Dict[str, bool] = {}
+        
+        def add_req(raw: str) -> None:
+            """Normalize a candidate requirement and keep it if new and skill-like."""
+            req = ' '.join(raw.split())
+            if req not in verdicts:
+                verdicts[req] = 2 <= len(req) <= 100 and _SKIP_RE.search(req) is None
+        
+        def add_reqs(raw: str) -> None:
+            """Split an inline list of requirements and add each item."""
+            for item in _LIST_SEP_RE.split(raw):
+                add_req(item)
+        
+        parsed = _tokenize_lines(lines[:_MAX_PARSED_LINES], lines_lower[:_MAX_PARSED_LINES])
+        for kind, line, line_lower in parsed:
+            has_trigger = _TRIGGER_RE.search(line_lower) is not None
+            
+            if has_trigger:
+                if not location_found:
+                    match = _LOCATION_RE.search(line)
+                    if match:
+                        details['location'] = match.group(match.lastgroup).strip()[:100]
+                        location_found = True
+                
+                # Every salary format carries a currency sigil or "eur"
+                if details['salary_min'] is None and ('$' in line_lower or '€' in line_lower or 'eur' in line_lower):
+                    salary_info = self._parse_salary(line_lower)
+                    if salary_info:
+                        details['salary_min'] = salary_info['min']
+                        details['salary_max'] = salary_info['max']
+                        details['currency'] = salary_info['currency']
+            
+            if kind == HEADER:
+                in_requirements = True
+                continue
+            
+            if in_requirements:
+                if kind == BULLET:
+                    add_req(line_lower.lstrip(_BULLET_CHARS))
+                    continue
+                in_requirements = False
+            
+            if has_trigger:
+                # "N years of experience ..." is one requirement; the other
+                # phrases introduce a list of them
+                for match in _REQ_RE.finditer(line_lower):
+                    if match.lastgroup == 'years':
+                        add_req(match.group('years'))
+                    else:
+                        add_reqs(match.group(match.lastgroup))
+                
+                for match in _TECH_RE.finditer(line_lower):
+                    add_reqs(match.group('val'))
+        
+        # Keywords never span lines, so one scan over the whole comment finds
+        # the same ones as a scan per line; repeats are dropped up front
+        for tech in dict.fromkeys(_TECH_KEYWORDS_RE.findall(text_lower)):
+            add_req(tech)
+        
+        details['requirements'] = [req for req, kept in verdicts.items() if kept]
+        return details
+    
+    def _parse_salary(self, text: str) -> Optional[Dict]:
+        """Parse a salary range from a lowercased line of text."""
+        match = _SALARY_RE.search(text)
+        if match is None:
+            return None
+        currency, multiplier = _SALARY_UNITS[match.lastgroup]
+        # Other branches' groups are None and the marker is empty; digits remain
+        values = [int(group.replace(',', '')) * multiplier for group in match.groups() if group]
+        return {'min': values[0], 'max': values[-1], 'currency': currency}
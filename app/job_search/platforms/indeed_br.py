@@ -1,31 +1,53 @@
 import aiohttp
 import asyncio
 import logging
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import re
-from datetime import datetime
+from typing import List, Dict, Any, Optional
 import urllib.parse
+from lxml import etree
 
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
+from ._html import card_matcher, first_selector, iter_cards, node_text, read_page, select_one
+from ._session import ScraperSession
 
 logger = logging.getLogger(__name__)
 
-class IndeedBrasilScraper:
+# Selectors used to locate job cards and their fields, compiled to XPath once;
+# Indeed's class names vary, so most fields have a fallback. Field selectors
+# only return their first match, which is all _parse_job_card reads
+_CARD_MATCHER = card_matcher('div[class*="job_seen_beacon"]')
+_DATA_JK_CARD_MATCHER = card_matcher('div[data-jk]')
+_CARD_TAGS = ('div',)
+_TITLE_HEADING_SELECTOR = first_selector('h2[class*="title"], h2[class*="jobTitle"]')
+_TITLE_LINK_SELECTOR = first_selector('a[class*="title"], a[class*="jobTitle"]')
+# "companyName" contains "company", so one substring test covers both
+_COMPANY_SPAN_SELECTOR = first_selector('span[class*="company"]')
+_COMPANY_DIV_SELECTOR = first_selector('div[class*="company"]')
+# The first link's href as a plain string, without building an element proxy
+_HREF_XPATH = etree.XPath('(descendant-or-self::a[@href])[1]/@href', smart_strings=False)
+_LOCATION_DIV_SELECTOR = first_selector('div[class*="location"], div[class*="companyLocation"]')
+_LOCATION_SPAN_SELECTOR = first_selector('span[class*="location"], span[class*="companyLocation"]')
+_SALARY_DIV_SELECTOR = first_selector('div[class*="salary"], div[class*="metadata"]')
+_SALARY_SPAN_SELECTOR = first_selector('span[class*="salary"], span[class*="metadata"]')
+
+class IndeedBrasilScraper(ScraperSession):
     """Scraper for Indeed Brasil job postings."""
     
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+    
     def __init__(self, config=None):
         self.config = config or {}
         self.base_url = "https://br.indeed.com"
         self.search_url = "https://br.indeed.com/empregos"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        # Every query parameter but the category is fixed
+        self._search_url_template = f"{self.search_url}?q={{}}&l=Brasil&sort=date&limit=20"
         
         # Technology job categories in Portuguese
         self.categories = [
@@ -47,129 +69,119 @@ class IndeedBrasilScraper:
             keywords = ["desenvolvedor", "engenheiro", "programador", "python", "react"]
         
         logger.info("Searching Indeed Brasil jobs...")
-        all_jobs = []
+        unique_jobs = []
+        seen_urls = set()
         
-        # Search in multiple categories
-        for category in self.categories[:5]:  # Limit to 5 categories for performance
-            try:
-                jobs = await self._scrape_category(category)
-                all_jobs.extend(jobs)
-                logger.info(f"Found {len(jobs)} jobs in {category} category")
-                
-                # Add delay between categories
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error scraping category {category}: {str(e)}")
-                continue
+        # Search in multiple categories concurrently over one keep-alive
+        # session; the semaphore throttles requests to the host instead of
+        # sleeping between categories
+        categories = self.categories[:5]  # Limit to 5 categories for performance
+        session = self._get_session()
+        semaphore = asyncio.Semaphore(2)
+        results = await asyncio.gather(
+            *(self._scrape_category(session, category, semaphore) for category in categories),
+            return_exceptions=True
+        )
         
-        # Remove duplicates based on URL
-        unique_jobs = {}
-        for job in all_jobs:
-            if job.url not in unique_jobs:
-                unique_jobs[job.url] = job
+        for category, result in zip(categories, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping category {category}: {str(result)}")
+                continue
+            logger.info(f"Found {len(result)} jobs in {category} category")
+            
+            # Drop duplicates based on URL as each category's jobs come in
+            for job in result:
+                if job.url not in seen_urls:
+                    unique_jobs.append(job)
+                    seen_urls.add(job.url)
         
         logger.info(f"Found {len(unique_jobs)} total unique jobs on Indeed Brasil")
-        return list(unique_jobs.values())
+        return unique_jobs
     
-    async def _scrape_category(self, category: str) -> List[JobPosting]:
+    async def _scrape_category(self, session: aiohttp.ClientSession, category: str,
+                               semaphore: asyncio.Semaphore) -> List[JobPosting]:
         """Scrape jobs from a specific category."""
         jobs = []
         
         try:
             # Indeed Brasil search URL structure
-            search_params = {
-                'q': category,
-                'l': 'Brasil',
-                'sort': 'date',
-                'limit': '20'
-            }
-            search_url = f"{self.search_url}?{urllib.parse.urlencode(search_params)}"
+            search_url = self._search_url_template.format(urllib.parse.quote_plus(category))
             logger.info(f"Scraping category: {search_url}")
             
-            async with aiohttp.ClientSession(headers=self.headers) as session:
+            async with semaphore:
                 async with session.get(search_url) as response:
                     if response.status != 200:
                         logger.warning(f"Failed to fetch {search_url}, status: {response.status}")
                         return jobs
                     
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Find job listings - Indeed uses various class names
-                    job_cards = soup.find_all('div', class_=re.compile(r'job_seen_beacon|jobsearch-ResultsList|job_seen_beacon'))
-                    
-                    if not job_cards:
-                        # Try alternative selectors
-                        job_cards = soup.find_all('div', {'data-jk': True})
+                    html = await read_page(response)
                     
-                    for card in job_cards[:20]:  # Limit to 20 jobs per category
-                        try:
-                            job = self._parse_job_card(card, category)
-                            if job:
-                                jobs.append(job)
-                        except Exception as e:
-                            logger.warning(f"Error parsing job card: {str(e)}")
-                            continue
+                    # Stream the job cards out of the page; Indeed uses various
+                    # class names, so the data-jk markup is only tried when the
+                    # main one matches nothing. Parsing stops after 20 per category
+                    for matcher in (_CARD_MATCHER, _DATA_JK_CARD_MATCHER):
+                        for card in iter_cards(html, matcher, _CARD_TAGS, limit=20):
+                            try:
+                                job = self._parse_job_card(card, category)
+                                if job:
+                                    jobs.append(job)
+                            except Exception as e:
+                                logger.warning(f"Error parsing job card: {str(e)}")
+                                continue
+                        if jobs:
+                            break
                     
         except Exception as e:
             logger.error(f"Error scraping Indeed Brasil category {category}: {str(e)}")
         
         return jobs
     
-    def _parse_job_card(self, card, category: str) -> JobPosting:
+    def _parse_job_card(self, card, category: str) -> Optional[JobPosting]:
         """Parse a job card to extract job information."""
         try:
             # Extract job title
-            title_elem = card.find('h2', class_=re.compile(r'title|jobTitle'))
-            if not title_elem:
-                title_elem = card.find('a', class_=re.compile(r'title|jobTitle'))
+            title_elem = select_one(card, _TITLE_HEADING_SELECTOR)
+            if title_elem is None:
+                title_elem = select_one(card, _TITLE_LINK_SELECTOR)
             
-            title = title_elem.get_text(strip=True) if title_elem else "Unknown Position"
+            title = node_text(title_elem) if title_elem is not None else "Unknown Position"
             
             # Extract company name
-            company_elem = card.find('span', class_=re.compile(r'company|companyName'))
-            if not company_elem:
-                company_elem = card.find('div', class_=re.compile(r'company|companyName'))
+            company_elem = select_one(card, _COMPANY_SPAN_SELECTOR)
+            if company_elem is None:
+                company_elem = select_one(card, _COMPANY_DIV_SELECTOR)
             
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company = node_text(company_elem) if company_elem is not None else "Unknown Company"
             
             # Extract job URL
-            url_elem = card.find('a', href=True)
-            if url_elem and url_elem.get('href'):
-                url = url_elem['href']
+            hrefs = _HREF_XPATH(card)
+            if hrefs and hrefs[0]:
+                url = hrefs[0]
                 if not url.startswith('http'):
                     url = self.base_url + url
             else:
                 url = f"{self.base_url}/empregos?q={category}"
             
             # Extract location
-            location_elem = card.find('div', class_=re.compile(r'location|companyLocation'))
-            if not location_elem:
-                location_elem = card.find('span', class_=re.compile(r'location|companyLocation'))
+            location_elem = select_one(card, _LOCATION_DIV_SELECTOR)
+            if location_elem is None:
+                location_elem = select_one(card, _LOCATION_SPAN_SELECTOR)
             
-            location = location_elem.get_text(strip=True) if location_elem else "Brasil"
+            location = node_text(location_elem) if location_elem is not None else "Brasil"
             
             # Extract salary (if available)
-            salary_elem = card.find('div', class_=re.compile(r'salary|metadata'))
-            if not salary_elem:
-                salary_elem = card.find('span', class_=re.compile(r'salary|metadata'))
+            salary_elem = select_one(card, _SALARY_DIV_SELECTOR)
+            if salary_elem is None:
+                salary_elem = select_one(card, _SALARY_SPAN_SELECTOR)
             
-            salary = salary_elem.get_text(strip=True) if salary_elem else ""
+            salary = node_text(salary_elem) if salary_elem is not None else ""
             
             # Create job posting
             job = JobPosting(
                 title=title,
-                company=company,
-                location=location,
-                url=url,
-                platform="Indeed Brasil",
-                category=category,
-                salary=salary,
-                posted_date=datetime.now().isoformat(),
-                description="",
-                requirements="",
-                benefits=""
+                description=DESCRIPTION_TEMPLATE % (company, location, salary, "Vaga encontrada no Indeed Brasil"),
+                email=None,  # Indeed doesn't show emails directly
+                url=url
             )
             
             return job
@@ -9,6 +9,61 @@ from loguru import logger
 
 from ..models import JobPosting
 
+# Fallback postings served when LinkedIn can't be searched; JobPosting is
+# frozen, so the same instances are handed out on every call
+_MOCK_JOBS = (
+    JobPosting(
+        title="Senior Full Stack Developer",
+        description="We are looking for a Senior Full Stack Developer with experience in React, Node.js, and Python. Must have 5+ years of experience in software development.",
+        email="jobs@techcompany.com",
+        url="https://linkedin.com/jobs/view/123456"
+    ),
+    JobPosting(
+        title="React Developer",
+        description="Join our team as a React Developer. We need someone with strong React skills and experience with TypeScript.",
+        email="careers@startup.com",
+        url="https://linkedin.com/jobs/view/123457"
+    ),
+    JobPosting(
+        title="Python Backend Engineer",
+        description="We are seeking a Python Backend Engineer with experience in Django and PostgreSQL. Knowledge of AI/ML is a plus.",
+        email="hr@datatech.com",
+        url="https://linkedin.com/jobs/view/123458"
+    ),
+)
+_ENHANCED_MOCK_JOBS = _MOCK_JOBS + (
+    JobPosting(
+        title="Full Stack Software Engineer",
+        description="Looking for a Full Stack Engineer with React and Node.js experience. Remote position with competitive salary.",
+        email="talent@innovate.com",
+        url="https://linkedin.com/jobs/view/123459"
+    ),
+    JobPosting(
+        title="Senior Backend Developer",
+        description="Senior Backend Developer needed for high-scale applications. Experience with Python, Django, and AWS required.",
+        email="recruiting@scaleup.com",
+        url="https://linkedin.com/jobs/view/123460"
+    ),
+    JobPosting(
+        title="Frontend Developer",
+        description="Frontend Developer with React and TypeScript experience. Join our growing team of developers.",
+        email="jobs@frontend.com",
+        url="https://linkedin.com/jobs/view/123461"
+    ),
+    JobPosting(
+        title="DevOps Engineer",
+        description="DevOps Engineer with AWS and Docker experience. Help us scale our infrastructure.",
+        email="ops@tech.com",
+        url="https://linkedin.com/jobs/view/123462"
+    ),
+    JobPosting(
+        title="Machine Learning Engineer",
+        description="ML Engineer with Python and TensorFlow experience. Work on cutting-edge AI projects.",
+        email="ai@mlcompany.com",
+        url="https://linkedin.com/jobs/view/123463"
+    ),
+)
+
 class LinkedInScraper:
     """LinkedIn job scraper with real credentials."""
     
@@ -223,82 +278,12 @@ class LinkedInScraper:
     
     def _get_enhanced_mock_jobs(self) -> List[JobPosting]:
         """Get enhanced mock jobs for LinkedIn."""
-        mock_jobs = [
-            JobPosting(
-                title="Senior Full Stack Developer",
-                description="We are looking for a Senior Full Stack Developer with experience in React, Node.js, and Python. Must have 5+ years of experience in software development.",
-                email="jobs@techcompany.com",
-                url="https://linkedin.com/jobs/view/123456"
-            ),
-            JobPosting(
-                title="React Developer",
-                description="Join our team as a React Developer. We need someone with strong React skills and experience with TypeScript.",
-                email="careers@startup.com",
-                url="https://linkedin.com/jobs/view/123457"
-            ),
-            JobPosting(
-                title="Python Backend Engineer",
-                description="We are seeking a Python Backend Engineer with experience in Django and PostgreSQL. Knowledge of AI/ML is a plus.",
-                email="hr@datatech.com",
-                url="https://linkedin.com/jobs/view/123458"
-            ),
-            JobPosting(
-                title="Full Stack Software Engineer",
-                description="Looking for a Full Stack Engineer with React and Node.js experience. Remote position with competitive salary.",
-                email="talent@innovate.com",
-                url="https://linkedin.com/jobs/view/123459"
-            ),
-            JobPosting(
-                title="Senior Backend Developer",
-                description="Senior Backend Developer needed for high-scale applications. Experience with Python, Django, and AWS required.",
-                email="recruiting@scaleup.com",
-                url="https://linkedin.com/jobs/view/123460"
-            ),
-            JobPosting(
-                title="Frontend Developer",
-                description="Frontend Developer with React and TypeScript experience. Join our growing team of developers.",
-                email="jobs@frontend.com",
-                url="https://linkedin.com/jobs/view/123461"
-            ),
-            JobPosting(
-                title="DevOps Engineer",
-                description="DevOps Engineer with AWS and Docker experience. Help us scale our infrastructure.",
-                email="ops@tech.com",
-                url="https://linkedin.com/jobs/view/123462"
-            ),
-            JobPosting(
-                title="Machine Learning Engineer",
-                description="ML Engineer with Python and TensorFlow experience. Work on cutting-edge AI projects.",
-                email="ai@mlcompany.com",
-                url="https://linkedin.com/jobs/view/123463"
-            )
-        ]
-        
+        mock_jobs = list(_ENHANCED_MOCK_JOBS)
         logger.info(f"✅ Found {len(mock_jobs)} jobs on LinkedIn (enhanced mock)")
         return mock_jobs
     
     def _get_mock_jobs(self) -> List[JobPosting]:
         """Get basic mock jobs for LinkedIn."""
-        mock_jobs = [
-            JobPosting(
-                title="Senior Full Stack Developer",
-                description="We are looking for a Senior Full Stack Developer with experience in React, Node.js, and Python. Must have 5+ years of experience in software development.",
-                email="jobs@techcompany.com",
-                url="https://linkedin.com/jobs/view/123456"
-            ),
-            JobPosting(
-                title="React Developer",
-                description="Join our team as a React Developer. We need someone with strong React skills and experience with TypeScript.",
-                email="careers@startup.com",
-                url="https://linkedin.com/jobs/view/123457"
-            ),
-            JobPosting(
-                title="Python Backend Engineer",
-                description="We are seeking a Python Backend Engineer with experience in Django and PostgreSQL. Knowledge of AI/ML is a plus.",
-                email="hr@datatech.com",
-                url="https://linkedin.com/jobs/view/123458"
-            )
-        ]
-        
+        mock_jobs = list(_MOCK_JOBS)
         logger.info(f"📋 Found {len(mock_jobs)} jobs on LinkedIn (basic mock)")
         return mock_jobs 
\ No newline at end of file
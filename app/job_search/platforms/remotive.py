@@ -3,27 +3,30 @@ Remotive Job Scraper
 """
 import asyncio
 import aiohttp
-import json
+import orjson
 from typing import Dict, List, Optional
 from loguru import logger
 
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
+from ._session import ScraperSession
 
-class RemotiveScraper:
+class RemotiveScraper(ScraperSession):
     """Remotive job scraper."""
     
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+    
     def __init__(self, config: Dict):
         """Initialize Remotive scraper."""
         self.config = config
         self.base_url = "https://remotive.com"
         self.api_url = "https://remotive.com/api/remote-jobs"
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
         
     async def search(self) -> List[JobPosting]:
         """Search for jobs on Remotive."""
@@ -49,19 +52,21 @@ class RemotiveScraper:
             # Focus on software development and related categories
             target_categories = ["software-dev", "devops-sysadmin", "product"]
             
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                for category in target_categories:
-                    try:
-                        category_jobs = await self._scrape_category(session, category)
-                        jobs.extend(category_jobs)
-                        logger.info(f"Found {len(category_jobs)} jobs in {category} category")
-                        
-                        # Add delay between requests
-                        await asyncio.sleep(2)
-                        
-                    except Exception as e:
-                        logger.error(f"Error scraping {category} category: {str(e)}")
-                        continue
+            # Scrape the categories concurrently; the semaphore throttles
+            # requests to the API instead of sleeping between categories
+            session = self._get_session()
+            semaphore = asyncio.Semaphore(2)
+            results = await asyncio.gather(
+                *(self._scrape_category(session, category, semaphore) for category in target_categories),
+                return_exceptions=True
+            )
+            
+            for category, result in zip(target_categories, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scraping {category} category: {str(result)}")
+                    continue
+                jobs.extend(result)
+                logger.info(f"Found {len(result)} jobs in {category} category")
             
             logger.info(f"Found {len(jobs)} total jobs on Remotive")
             return jobs
@@ -70,7 +75,8 @@ class RemotiveScraper:
             logger.error(f"Error searching Remotive: {str(e)}")
             return []
     
-    async def _scrape_category(self, session: aiohttp.ClientSession, category: str) -> List[JobPosting]:
+    async def _scrape_category(self, session: aiohttp.ClientSession, category: str,
+                               semaphore: asyncio.Semaphore) -> List[JobPosting]:
         """Scrape jobs from a specific category."""
         jobs = []
         
@@ -79,24 +85,25 @@ class RemotiveScraper:
             url = f"{self.api_url}?category={category}&limit=20"
             logger.info(f"Scraping category: {url}")
             
-            async with session.get(url) as response:
-                if response.status != 200:
-                    logger.warning(f"Failed to fetch {url}, status: {response.status}")
-                    return jobs
-                
-                data = await response.json()
-                
-                if 'jobs' in data:
-                    for job_data in data['jobs'][:10]:  # Limit to 10 jobs per category
-                        try:
-                            job = self._parse_job_data(job_data)
-                            if job:
-                                jobs.append(job)
-                                
-                        except Exception as e:
-                            logger.error(f"Error parsing job data: {str(e)}")
-                            continue
-                
+            async with semaphore:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        logger.warning(f"Failed to fetch {url}, status: {response.status}")
+                        return jobs
+                    
+                    data = orjson.loads(await response.read())
+                    
+                    if 'jobs' in data:
+                        for job_data in data['jobs'][:10]:  # Limit to 10 jobs per category
+                            try:
+                                job = self._parse_job_data(job_data)
+                                if job:
+                                    jobs.append(job)
+                                    
+                            except Exception as e:
+                                logger.error(f"Error parsing job data: {str(e)}")
+                                continue
+                    
         except Exception as e:
             logger.error(f"Error scraping category {category}: {str(e)}")
         
@@ -123,7 +130,7 @@ class RemotiveScraper:
             # Create job posting
             job = JobPosting(
                 title=title,
-                description=f"Company: {company}\nLocation: {location}\nSalary: {salary}\n\n{description}",
+                description=DESCRIPTION_TEMPLATE % (company, location, salary, description),
                 email=None,  # Remotive doesn't show emails directly
                 url=job_url
             )
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 from loguru import logger
 
 from ..models import JobPosting
+from ._description import DESCRIPTION_TEMPLATE
 
 class WeWorkRemotelyScraper:
     """WeWorkRemotely job scraper."""
@@ -143,7 +144,7 @@ class WeWorkRemotelyScraper:
                 # Create job posting
                 job = JobPosting(
                     title=title,
-                    description=f"Company: {company}\nLocation: {location}\nSalary: {salary}\n\n{description}",
+                    description=DESCRIPTION_TEMPLATE % (company, location, salary, description),
                     email=None,  # WeWorkRemotely doesn't show emails directly
                     url=job_url
                 )
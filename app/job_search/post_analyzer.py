@@ -6,6 +6,8 @@ from datetime import datetime
 
 from loguru import logger
 
+from ._matchers import detect_remote
+
 @dataclass
 class JobPostInfo:
     """Structured information extracted from a job post."""
@@ -183,7 +185,7 @@ class PostAnalyzer:
             match = re.search(pattern, text)
             if match:
                 location = match.group(1).strip()
-                if any(remote in location.lower() for remote in ['remote', 'anywhere', 'worldwide']):
+                if detect_remote(location):
                     return 'Remote'
                 return location.capitalize()
         return 'Not specified'
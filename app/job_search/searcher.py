@@ -214,6 +214,23 @@ class JobSearcher:
             logger.error(f"❌ Error searching jobs: {str(e)}")
             return []
     
+    async def close(self):
+        """Release resources held by scrapers (e.g. pooled HTTP sessions)."""
+        for scraper in self.scrapers:
+            close = getattr(scraper, 'close', None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                logger.warning(f"Error closing {scraper.__class__.__name__}: {str(e)}")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
     async def _search_with_logging(self, scraper, keywords: List[str]) -> List[JobPosting]:
         """Search with a specific scraper and log the results."""
         platform = scraper.__class__.__name__
@@ -0,0 +1,17 @@
+"""Event loop setup."""
+from loguru import logger
+
+def install_uvloop() -> bool:
+    """Make asyncio.run() use uvloop when it is available.
+    
+    The scrapers spend most of their time awaiting aiohttp futures, where
+    uvloop's libuv-based loop is markedly faster than the default one.
+    Falls back to the standard loop where uvloop is not installed (e.g. Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return False
+    uvloop.install()
+    return True
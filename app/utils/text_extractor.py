@@ -1,22 +1,32 @@
 """Text extraction utilities."""
 import re
 from typing import List, Optional
-from bs4 import BeautifulSoup
 from loguru import logger
+import lxml.html
+from lxml import etree
+
+# Elements whose content is never readable text
+_NON_TEXT_TAGS = ('script', 'style', 'noscript', 'template')
 
 def clean_text(text: str) -> str:
     """Clean text by removing HTML and normalizing whitespace."""
     try:
-        # Parse HTML
-        soup = BeautifulSoup(text, 'html.parser')
-        # Get text content
-        text = soup.get_text()
-        # Normalize whitespace
-        text = ' '.join(text.split())
-        return text
+        # Parse HTML with lxml's C parser, then normalize whitespace
+        return ' '.join(html_to_text(text).split())
     except:
         return text
 
+def html_to_text(text: str) -> str:
+    """Strip HTML tags and decode entities in a single parse."""
+    if not text:
+        return text
+    try:
+        root = lxml.html.fragment_fromstring(text, create_parent='div')
+        etree.strip_elements(root, *_NON_TEXT_TAGS, with_tail=False)
+        return root.text_content()
+    except Exception:
+        return text
+
 def extract_emails_from_text(text: str) -> List[str]:
     """
     Extract email addresses from text.
@@ -78,9 +88,8 @@ def extract_emails_from_text(text: str) -> List[str]:
         matches = re.finditer(pattern, text, re.IGNORECASE)
         for match in matches:
             email = match.group(0)
-            # Clean up the email
-            email = email.strip().lower()
-            email = re.sub(r'\s+', '', email)
+            # Clean up the email: lowercase and drop every blank in one C-level pass
+            email = ''.join(email.lower().split())
             if is_valid_email(email):
                 emails.add(email)
                 
@@ -95,9 +104,8 @@ def extract_emails_from_text(text: str) -> List[str]:
         matches = re.finditer(pattern, text, re.IGNORECASE)
         for match in matches:
             email = match.group(1)
-            # Clean up the email
-            email = email.strip().lower()
-            email = re.sub(r'\s+', '', email)
+            # Clean up the email: lowercase and drop every blank in one C-level pass
+            email = ''.join(email.lower().split())
             if is_valid_email(email):
                 emails.add(email)
                 
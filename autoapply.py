@@ -19,6 +19,7 @@ from app.matching.matcher import JobMatcher
 from app.automation.applicator_manager import ApplicatorManager
 from app.automation.application_logger import ApplicationLogger, ApplicationStatus
 from app.main import load_config, load_profile
+from app.utils.event_loop import install_uvloop
 
 async def main():
     """Função principal do sistema AutoApply.AI."""
@@ -45,8 +46,8 @@ async def main():
         
         # 3. Buscar vagas
         logger.info("🔍 3. Iniciando busca de vagas...")
-        searcher = JobSearcher(config, app_logger)
-        all_jobs = await searcher.search()
+        async with JobSearcher(config, app_logger) as searcher:
+            all_jobs = await searcher.search()
         
         logger.info(f"   📊 Total de vagas encontradas: {len(all_jobs)}")
         
@@ -272,4 +273,5 @@ async def _apply_to_job(match, job_number: int, app_logger) -> Dict:
         return {'status': 'failed', 'success': False, 'error': str(e)}
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
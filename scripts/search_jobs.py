@@ -16,6 +16,7 @@ from loguru import logger
 
 from app.job_search import JobSearcher
 from app.job_search.models import JobPosting
+from app.utils.event_loop import install_uvloop
 
 def load_config(config_dir: str) -> Dict:
     """Load configuration from YAML and .env files."""
@@ -131,11 +132,9 @@ async def main():
         # Get search terms
         keywords = get_search_terms(profile)
         
-        # Initialize job searcher
-        searcher = JobSearcher()
-        
-        # Search for jobs
-        jobs = await searcher.search(keywords=keywords)
+        # Search for jobs; leaving the block closes the scrapers' sessions
+        async with JobSearcher() as searcher:
+            jobs = await searcher.search(keywords=keywords)
         
         # Print job summary
         print_job_summary(jobs)
@@ -150,4 +149,5 @@ async def main():
         raise
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main()) 
\ No newline at end of file
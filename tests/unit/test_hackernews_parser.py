@@ -0,0 +1,144 @@
+"""
+Unit tests for the HackerNews "Who is hiring?" comment parser
+"""
+import asyncio
+import re
+import time
+
+import pytest
+
+from app.job_search.platforms.hackernews import (
+    BULLET, HEADER, TEXT, HackerNewsScraper, _RESULTS_TTL, _clean_html, _tokenize_lines, _trie_pattern
+)
+
+# A top-level comment as Algolia returns it: HN markup, escaped punctuation
+COMMENT = (
+    "Acme Corp | Senior Backend Engineer | Berlin | €70k - €90k<p>"
+    "We build payment infrastructure with Python, Go and PostgreSQL. "
+    "You should know Kubernetes and Terraform.<p>"
+    "Requirements:<p>"
+    "- 5+ years of experience building APIs<p>"
+    "- Strong knowledge of distributed systems<p>"
+    "Apply at jobs@acme.com &#x2F; <a href=\"https:&#x2F;&#x2F;acme.com\">acme.com</a>"
+)
+
+@pytest.fixture
+def scraper():
+    return HackerNewsScraper({})
+
+def test_clean_html_puts_paragraphs_on_lines():
+    text = _clean_html(COMMENT)
+    
+    lines = text.split('\n')
+    assert lines[0] == "Acme Corp | Senior Backend Engineer | Berlin | €70k - €90k"
+    assert lines[-1] == "Apply at jobs@acme.com / acme.com"
+
+def test_parse_job_details_reads_the_header_line(scraper):
+    details = scraper._parse_job_details(_clean_html(COMMENT))
+    
+    assert details['company'] == 'Acme Corp'
+    assert details['title'] == 'Senior Backend Engineer'
+    assert (details['salary_min'], details['salary_max'], details['currency']) == (70000, 90000, 'EUR')
+
+def test_parse_job_details_splits_inline_lists(scraper):
+    """Each item of "with python, go and postgresql" is its own requirement."""
+    details = scraper._parse_job_details(_clean_html(COMMENT))
+    
+    assert details['requirements'] == [
+        'kubernetes', 'terraform', 'python', 'go', 'postgresql',
+        '5+ years of experience building apis',
+        'strong knowledge of distributed systems',
+    ]
+
+def test_parse_job_details_defaults_and_location(scraper):
+    details = scraper._parse_job_details("Initech | Office Manager\nOnsite in Austin, TX. Apply by email")
+    
+    assert details['company'] == 'Initech'
+    assert details['title'] == 'Office Manager'
+    assert details['location'] == 'Austin, TX'
+    assert details['salary_min'] is None
+    assert details['requirements'] == []
+
+def test_parse_job_details_skips_sentence_fragments(scraper):
+    details = scraper._parse_job_details("Globex\nWe are looking for people with great attitude and rust")
+    
+    assert details['title'] == 'Unknown Position'
+    assert details['location'] == 'Remote'
+    assert details['requirements'] == ['rust']
+
+@pytest.mark.parametrize('text, expected', [
+    ('$120k - $150k', {'min': 120000, 'max': 150000, 'currency': 'USD'}),
+    ('$120,000 to $150,000 base', {'min': 120000, 'max': 150000, 'currency': 'USD'}),
+    ('$8,000/month', {'min': 96000, 'max': 96000, 'currency': 'USD'}),
+    ('up to $150k + equity', {'min': 150000, 'max': 150000, 'currency': 'USD'}),
+    ('€60k–€80k', {'min': 60000, 'max': 80000, 'currency': 'EUR'}),
+    ('60k - 80k eur', {'min': 60000, 'max': 80000, 'currency': 'EUR'}),
+    ('competitive salary', None),
+])
+def test_parse_salary(scraper, text, expected):
+    assert scraper._parse_salary(text) == expected
+
+def test_tokenize_lines_classifies_lines():
+    lines = ["Acme | Engineer", "", "Requirements:", "  - Python", "• SQL", "Tech stack: Go", "Apply now"]
+    
+    tokens = list(_tokenize_lines(lines, [line.lower() for line in lines]))
+    
+    assert tokens == [
+        (TEXT, "Acme | Engineer", "acme | engineer"),
+        (HEADER, "Requirements:", "requirements:"),
+        (BULLET, "- Python", "- python"),
+        (BULLET, "• SQL", "• sql"),
+        (HEADER, "Tech stack: Go", "tech stack: go"),
+        (TEXT, "Apply now", "apply now"),
+    ]
+
+@pytest.mark.parametrize('words', [
+    ['go', 'golang'],
+    ['postgres', 'postgresql', 'python'],
+    ['c', 'c++', 'c#'],
+    ['node', 'node.js', 'next.js'],
+])
+def test_trie_pattern_matches_the_same_words(words):
+    """Factored by prefix, the alternation accepts exactly the words given."""
+    pattern = re.compile(_trie_pattern(words))
+    
+    for word in words:
+        assert pattern.fullmatch(word)
+    assert not pattern.fullmatch(words[0] + 'x')
+    assert not pattern.fullmatch('')
+
+def test_trie_pattern_prefers_the_longest_word():
+    pattern = re.compile(_trie_pattern(['postgres', 'postgresql']))
+    
+    assert pattern.match('postgresql').group() == 'postgresql'
+
+def test_parse_job_details_location_after_case_changing_text(scraper):
+    """"İ" lowercases to two characters; the location must not shift."""
+    details = scraper._parse_job_details("Acme | Engineer\nİstanbul Location: Remote (EU)")
+    
+    assert details['location'] == 'Remote (EU)'
+
+class StubScraper(HackerNewsScraper):
+    """Serves one page holding COMMENT from a fixed thread, without the network."""
+    
+    __slots__ = ()
+    
+    async def get_latest_who_is_hiring_thread(self):
+        return "100"
+    
+    async def _fetch_comment_page(self, session, thread_id, page):
+        return {'hits': [{'objectID': '1', 'parent_id': 100, 'updated_at': 'x', 'comment_text': COMMENT}]}
+
+def test_search_drops_expired_results():
+    """Storing new results evicts those past their TTL."""
+    scraper = StubScraper({})
+    scraper._cache[('99', ('java',))] = (time.monotonic() - _RESULTS_TTL - 1, [])
+    
+    async def run():
+        async with scraper:
+            return await scraper.search(['python'])
+    
+    jobs = asyncio.run(run())
+    
+    assert [job.title for job in jobs] == ['Senior Backend Engineer']
+    assert list(scraper._cache) == [('100', ('python',))]
@@ -0,0 +1,64 @@
+"""
+Unit tests for the job search models
+"""
+import copy
+import pickle
+
+import pytest
+
+from app.job_search.models import Job, JobPosting
+
+def make_job(**overrides) -> Job:
+    """Build a Job with placeholder values for the fields a test doesn't set."""
+    values = {
+        "title": "Backend Engineer",
+        "company": "ACME",
+        "location": "Remote",
+        "description": "",
+        "url": "https://example.com/jobs/1",
+        "platform": "test",
+    }
+    values.update(overrides)
+    return Job(**values)
+
+def test_job_description_only_unescapes_entities():
+    """Plain-text descriptions keep their line breaks and literal angle brackets."""
+    description = "Python &amp; Go\n\nSalary <negotiable>\nApply at jobs@acme.com"
+    
+    job = make_job(description=description)
+    
+    assert job.description == "Python & Go\n\nSalary <negotiable>\nApply at jobs@acme.com"
+
+def test_job_posting_emails_do_not_span_title_and_description():
+    """An obfuscated address can't be stitched from the end of the title and the start of the description."""
+    posting = JobPosting(
+        title="Senior Python Engineer",
+        description="@ acme.com we ship daily. Contact hr@acme.com",
+    )
+    
+    assert posting.extracted_emails == ["hr@acme.com"]
+    assert posting.email == "hr@acme.com"
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda job: pickle.loads(pickle.dumps(job))],
+                         ids=["copy", "deepcopy", "pickle"])
+def test_job_posting_round_trips(clone):
+    """Frozen, slotted postings survive copy, deepcopy and pickle unchanged."""
+    posting = JobPosting(
+        title="Backend Engineer",
+        description="Write to jobs@acme.com",
+        url="https://example.com/jobs/1",
+    )
+    
+    cloned = clone(posting)
+    
+    assert cloned == posting
+    assert cloned.extracted_emails == ["jobs@acme.com"]
+    assert not hasattr(cloned, "__dict__")
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda job: pickle.loads(pickle.dumps(job))],
+                         ids=["copy", "deepcopy", "pickle"])
+def test_job_round_trips(clone):
+    """Slotted jobs survive copy, deepcopy and pickle unchanged."""
+    job = make_job(description="Pays $100K-150K", skills={"python"})
+    
+    assert clone(job) == job
@@ -0,0 +1,84 @@
+"""
+Unit tests for the lxml helpers shared by the HTML job-card scrapers
+"""
+from app.job_search.platforms._html import card_matcher, find_cards, iter_cards, node_text, parse_html
+
+CARD_TAGS = ('div', 'article')
+
+# A results container holding five cards after a heading
+LISTING_PAGE = """
+<html><body>
+  <div class="search-results">
+    <h1>Open positions</h1>
+    <div class="job-card"><h2>Job 1</h2> <span>ACME</span></div>
+    <div class="job-card"><h2>Job 2</h2> <span>Initech</span></div>
+    <div class="job-card"><h2>Job 3</h2> <span>Globex</span></div>
+    <article class="job-card"><h2>Job 4</h2> <span>Hooli</span></article>
+    <div class="job-card"><h2>Job 5</h2> <span>Umbrella</span></div>
+  </div>
+  <div class="footer">About</div>
+</body></html>
+"""
+
+# Cards whose own parts match the substring selector as well, as with BEM
+# class names
+NESTED_PAGE = """
+<html><body>
+  <div class="job-card"><h2>Outer 1</h2> <div class="job-card__footer">New</div></div>
+  <div class="job-card"><h2>Outer 2</h2> <div class="job-card__footer">Hot</div></div>
+</body></html>
+"""
+
+MATCHER = card_matcher('div[class*="job"], article[class*="job"]')
+
+def test_find_cards_returns_matches_in_document_order():
+    """Enclosing matches come before the ones inside them, as in a full-tree search."""
+    cards = find_cards(parse_html(NESTED_PAGE), MATCHER, CARD_TAGS, limit=10)
+    
+    assert [card.get('class') for card in cards] == ['job-card', 'job-card__footer'] * 2
+    assert node_text(cards[0]) == 'Outer 1 New'
+
+def test_find_cards_stops_at_limit():
+    """Only the first limit matches are returned."""
+    cards = find_cards(parse_html(LISTING_PAGE), MATCHER, CARD_TAGS, limit=2)
+    
+    assert [node_text(card) for card in cards] == ['Job 1 ACME', 'Job 2 Initech']
+
+def test_iter_cards_yields_intact_cards():
+    """Each card is whole while it is consumed."""
+    texts = [node_text(card) for card in iter_cards(LISTING_PAGE, MATCHER, CARD_TAGS, limit=10)]
+    
+    assert texts == ['Job 1 ACME', 'Job 2 Initech', 'Job 3 Globex', 'Job 4 Hooli', 'Job 5 Umbrella']
+
+def test_iter_cards_yields_outermost_match():
+    """Matches inside an open card are parts of it, not cards of their own."""
+    texts = [node_text(card) for card in iter_cards(NESTED_PAGE, MATCHER, CARD_TAGS, limit=10)]
+    
+    assert texts == ['Outer 1 New', 'Outer 2 Hot']
+
+def test_iter_cards_yields_matching_container_whole():
+    """A container that matches too is yielded once, with every card inside it."""
+    page = LISTING_PAGE.replace('search-results', 'jobs-list')
+    
+    cards = [(card.get('class'), len(card.findall('div'))) for card in iter_cards(page, MATCHER, CARD_TAGS, limit=10)]
+    
+    assert cards == [('jobs-list', 4)]
+
+def test_iter_cards_drops_consumed_cards_from_the_tree():
+    """Cards already consumed are cleared and removed, so the tree doesn't grow."""
+    for card in iter_cards(LISTING_PAGE, MATCHER, CARD_TAGS, limit=10):
+        previous = card.getprevious()
+        # At most the card consumed just before survives, and it is empty
+        assert previous is None or previous.tag == 'h1' or len(previous) == 0
+        assert previous is None or previous.getprevious() is None
+
+def test_iter_cards_stops_at_limit():
+    """The stream ends after limit cards and the last one is left intact."""
+    cards = iter_cards(LISTING_PAGE.encode('utf-8'), MATCHER, CARD_TAGS, limit=2)
+    
+    first = next(cards)
+    assert node_text(first) == 'Job 1 ACME'
+    second = next(cards)
+    assert node_text(second) == 'Job 2 Initech'
+    assert next(cards, None) is None
+    assert node_text(second) == 'Job 2 Initech'
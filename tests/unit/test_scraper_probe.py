@@ -0,0 +1,88 @@
+"""
+Unit tests for concurrent URL/endpoint probing
+"""
+import asyncio
+
+import pytest
+
+from app.job_search.platforms._probe import first_result, first_result_in_order
+
+async def probe(result, delay: float, cancelled: set, name: str):
+    """Return result after delay, recording name in cancelled if cancelled first."""
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        cancelled.add(name)
+        raise
+    return result
+
+@pytest.mark.asyncio
+async def test_first_result_returns_first_truthy_and_cancels_the_rest():
+    """A fast falsy result is skipped and the slower probes are cancelled."""
+    cancelled = set()
+    
+    result = await first_result([
+        probe('slow', 10, cancelled, 'slow'),
+        probe(None, 0, cancelled, 'empty'),
+        probe('fast', 0.01, cancelled, 'fast'),
+        probe('slower', 20, cancelled, 'slower'),
+    ])
+    await asyncio.sleep(0)  # let the cancellations be delivered
+    
+    assert result == 'fast'
+    assert cancelled == {'slow', 'slower'}
+
+@pytest.mark.asyncio
+async def test_first_result_returns_none_when_every_probe_fails():
+    """All-falsy probes give None."""
+    cancelled = set()
+    
+    result = await first_result([probe(None, 0, cancelled, 'a'), probe([], 0.01, cancelled, 'b')])
+    
+    assert result is None
+    assert not cancelled
+
+@pytest.mark.asyncio
+async def test_first_result_cancels_probes_when_cancelled():
+    """Cancelling the caller cancels every probe still running."""
+    cancelled = set()
+    
+    task = asyncio.ensure_future(first_result([probe('a', 10, cancelled, 'a'), probe('b', 10, cancelled, 'b')]))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    
+    assert cancelled == {'a', 'b'}
+
+@pytest.mark.asyncio
+async def test_first_result_in_order_prefers_earlier_probes():
+    """A slower earlier probe wins over a faster later one; later probes are cancelled."""
+    cancelled = set()
+    
+    result = await first_result_in_order([
+        probe(None, 0.02, cancelled, 'dead'),
+        probe('/vagas/', 0.05, cancelled, 'preferred'),
+        probe('/busca/', 0, cancelled, 'generic'),
+        probe('/empregos/', 10, cancelled, 'slow'),
+    ])
+    await asyncio.sleep(0)
+    
+    assert result == '/vagas/'
+    assert cancelled == {'slow'}
+
+@pytest.mark.asyncio
+async def test_first_result_in_order_falls_back_to_later_probes():
+    """When every earlier probe fails, the first later success is returned."""
+    cancelled = set()
+    
+    result = await first_result_in_order([
+        probe(None, 0.02, cancelled, 'a'),
+        probe('', 0, cancelled, 'b'),
+        probe('c', 0.01, cancelled, 'c'),
+        probe('d', 0, cancelled, 'd'),
+    ])
+    
+    assert result == 'c'
+    assert not cancelled
@@ -0,0 +1,102 @@
+"""
+Unit tests for the shared scraper session mixin
+"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from app.job_search.platforms import _session
+from app.job_search.platforms._html import MAX_PAGE_BYTES, read_page
+from app.job_search.platforms._session import ScraperSession
+
+class DummyScraper(ScraperSession):
+    """Minimal scraper using the mixin."""
+    
+    HEADERS = {"User-Agent": "test"}
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path, monkeypatch):
+    """Keep the response cache out of the working tree."""
+    monkeypatch.setattr(_session, "CACHE_PATH", tmp_path / "scrapers.sqlite")
+
+def test_headers_are_read_only():
+    """Subclass headers are frozen when the class is created."""
+    with pytest.raises(TypeError):
+        DummyScraper.HEADERS["User-Agent"] = "changed"
+
+def test_session_is_reused_on_the_same_loop():
+    """Repeated lookups on one loop share a session."""
+    async def run():
+        async with DummyScraper() as scraper:
+            first = scraper._get_session()
+            assert scraper._get_session() is first
+        assert first.closed
+        assert scraper._session is None
+    
+    asyncio.run(run())
+
+def test_session_is_recreated_on_a_new_loop():
+    """A scraper reused by a second asyncio.run() gets a session bound to the new loop."""
+    scraper = DummyScraper()
+    
+    async def get_session():
+        return scraper._get_session()
+    
+    first = asyncio.run(get_session())
+    
+    async def reuse():
+        second = scraper._get_session()
+        await asyncio.sleep(0.1)  # let the stale session's close run
+        await scraper.close()
+        return second
+    
+    second = asyncio.run(reuse())
+    
+    assert second is not first
+    assert first.closed
+    assert second.closed
+
+def test_cache_skips_pages_over_the_read_cap(tmp_path):
+    """Bodies larger than read_page's cap, or of unknown size, are streamed, not cached."""
+    small = b'<html>ok</html>'
+    big = b'x' * (MAX_PAGE_BYTES * 2)
+    
+    async def sized(request):
+        return web.Response(body=big if request.path == '/big' else small)
+    
+    async def chunked(request):
+        response = web.StreamResponse()
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(small)
+        return response
+    
+    app = web.Application()
+    app.router.add_get('/small', sized)
+    app.router.add_get('/big', sized)
+    app.router.add_get('/chunked', chunked)
+    
+    async def run():
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with DummyScraper() as scraper:
+                session = scraper._get_session()
+                pages = {}
+                for path in ('/small', '/big', '/chunked'):
+                    async with session.get(f'http://127.0.0.1:{port}{path}') as response:
+                        pages[path] = await read_page(response)
+                cached = [str(response.url) async for response in session.cache.responses.values()]
+        finally:
+            await runner.cleanup()
+        return pages, cached
+    
+    pages, cached = asyncio.run(run())
+    
+    assert pages == {'/small': small, '/big': big[:MAX_PAGE_BYTES], '/chunked': small}
+    assert [url.rsplit('/', 1)[1] for url in cached] == ['small']
+    assert (tmp_path / 'scrapers.sqlite').stat().st_size < MAX_PAGE_BYTES